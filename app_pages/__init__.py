@@ -0,0 +1,23 @@
+from lazy_imports import timed_import
+
+# Page registry: menu entry -> module rendering it.
+# A page module is only imported the first time its entry is selected. Each module
+# defines load_data(), returning the (cached) datasets it depends on, and render(data).
+PAGES = {
+    "Home": "app_pages.home",
+    "Global Overview": "app_pages.global_overview",
+    "Finland - Case Study": "app_pages.finland",
+    "Eco-anxiety": "app_pages.eco_anxiety",
+    "Leuphana Survey": "app_pages.leuphana_survey",
+    "References": "app_pages.references",
+}
+
+
+def load_page(name):
+    """Imports (once per process) and returns the module of a page."""
+    return timed_import(PAGES[name], context=name)
+
+
+def render_page(name):
+    page = load_page(name)
+    page.render(page.load_data())
@@ -0,0 +1,300 @@
+import os
+
+import streamlit as st
+import pandas as pd
+
+from country_codes import iso2_to_iso3, iso3_to_name
+from data_loader import cached_load, load_csv
+from flag_store import flag_data_uri, warm_flags, refresh_flags_async
+from geo_data import geojson_with_values
+from lazy_imports import lazy_import
+
+alt = lazy_import('altair')
+px = lazy_import('plotly.express')
+branca_colormap = lazy_import('branca.colormap')
+folium = lazy_import('folium')
+
+
+def load_data():
+    """Datasets used by this page, parsed once per process (see data_loader.py)."""
+    return {
+        'climate_df': load_csv('share-believe-climate.csv'),
+        # Eurobarometer preferences, copied since the country codes are converted in place
+        'df_euro': cached_load('Q8.xlsx', pd.read_excel).copy(deep=False),
+    }
+
+
+def render(data):
+    climate_df = data['climate_df']
+    df_euro = data['df_euro']
+
+    st.title(f"Sustainability, wellbeing and eco-anxiety: a deeper dive in the topic.")   
+    st.markdown("""
+        Climate change isn’t just an environmental crisis, it’s an emotional one too. More and more people,
+        especially young individuals, are experiencing <span style='background-color: LemonChiffon;'><b>eco-anxiety</b>, a deep sense of worry, fear, and helplessness 
+        about the future of our planet.</span> The reality of climate change feels overwhelming, and many struggle 
+        with feelings of uncertainty and frustration, particularly when they see a lack of urgent action 
+        from governments and institutions.""",
+        unsafe_allow_html=True
+    )
+
+    # Title
+    st.write("## Distribution of health professionals' opinion on climate change impact")
+
+    st.markdown(
+        "In 2020, a global survey asked health professionals about the effects of climate change on mental health conditions "
+        "like anxiety and depression. The following bar chart summarizes their perspectives:"
+    )
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Data for the bar chart
+        data = pd.DataFrame({
+            'Opinions': ['More frequent or severe', 'Less frequent or severe', 'Will remain unchanged', "Don't know"],
+            'Percentage': [76.8, 2.2, 13.2, 7.9]
+        })
+
+        # Create Altair horizontal bar chart
+        chart = alt.Chart(data).mark_bar(color='lightblue').encode(
+            y=alt.Y('Opinions', sort=None, title='Opinions', axis=alt.Axis(labelLimit=300)),
+            x=alt.X('Percentage', title='Percentage (%)'),
+            tooltip=['Opinions', 'Percentage']
+        ).properties(
+            width=700,
+            height=400,
+            title=""
+        )
+
+        # Display the chart in Streamlit
+        st.altair_chart(chart, use_container_width=True)
+
+    with col2:
+        st.markdown(
+            """
+            <div style="margin: 100px 50px; font-size: 23px;">
+            In 2020, medical professionals largely agreed that climate change related issues will make people's
+            mental conditions <b>more frequent or severe in the future.</b>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+    
+    st.markdown("## Personal revelance")
+    st.markdown("""
+        Depending on the extent to which we are personally confronted with the effects of climate change, 
+        we can assess the importance of measures very differently. Those who experience the impacts first-hand often feel a 
+        greater sense of urgency to act. This personal connection can influence how we prioritize the issue.
+        """)
+    
+    col1, col2 = st.columns(2)
+
+    with col1:
+
+        st.markdown("### People who are personally exposed")
+
+        # Updated data from the image
+        exposure_data = {
+            "Belgium": 30, "Bulgaria": 48, "Czech Republic": 24, "Denmark": 12, "Germany": 18,
+            "Estonia": 18, "Ireland": 28, "Greece": 59, "Spain": 48, "France": 33,
+            "Croatia": 52, "Italy": 43, "Cyprus": 57, "Latvia": 26, "Lithuania": 22,
+            "Luxembourg": 26, "Hungary": 62, "Malta": 63, "Netherlands": 26, "Austria": 28,
+            "Poland": 56, "Portugal": 64, "Romania": 45, "Slovenia": 32, "Slovakia": 49,
+            "Finland": 9, "Sweden": 21
+        }
+
+        # Convert data to DataFrame
+        ex_df = pd.DataFrame(list(exposure_data.items()), columns=["Country", "Percentage"])
+
+        # Country name mapping to match GeoJSON format
+        country_name_mapping = {
+            "Czech Republic": "Czechia"
+        }
+        ex_df["Country"] = ex_df["Country"].replace(country_name_mapping)
+
+        # Load the bundled GeoJSON (cached per process) with the percentages merged in for better tooltips
+        geojson_data = geojson_with_values(dict(zip(ex_df["Country"], ex_df["Percentage"])), "Percentage")
+
+        # Create a folium map with a tileset that shows English names
+        m = folium.Map(location=[54.5260, 15.2551], zoom_start=3, tiles="CartoDB Positron")
+
+        # Create a color scale
+        colormap = branca_colormap.linear.RdYlGn_11.scale(ex_df["Percentage"].min(), ex_df["Percentage"].max())
+
+        # Add choropleth layer to shade entire countries
+        choropleth = folium.Choropleth(
+            geo_data=geojson_data,
+            name="choropleth",
+            data=ex_df,
+            columns=["Country", "Percentage"],
+            key_on="feature.properties.name",
+            fill_color="RdYlGn",
+            fill_opacity=0.7,
+            line_opacity=0.2,
+            legend_name="Exposure (%)"
+        ).add_to(m)
+
+        folium.GeoJson(
+            geojson_data,
+            tooltip=folium.GeoJsonTooltip(
+                fields=["name", "Percentage"],
+                aliases=["Country: ", "Percentage: "],
+                localize=True
+            )
+        ).add_to(m)
+
+        # Display the map in Streamlit
+        st.components.v1.html(m._repr_html_(), height=600)
+
+    with col2:
+
+        st.markdown("### People who take climate change seriously")
+        # Read data
+        data = climate_df
+
+        # Filter for the most recent year
+        latest_year = data['Year'].max()
+        data_latest = data[data['Year'] == latest_year]
+
+        # Rename columns for better readability
+        data_latest = data_latest.rename(columns={
+            'Entity': 'Country',
+            'Code': 'Country Code',
+            'Believe climate change is a serious threat to humanity': 'Belief (%)'
+        })
+
+        # Create a dictionary for the belief data
+        belief_data = dict(zip(data_latest['Country'], data_latest['Belief (%)']))
+
+        # Load the bundled GeoJSON (cached per process) with the belief data merged in for better tooltips
+        geojson_data = geojson_with_values(belief_data, "Belief (%)")
+
+        # Create a folium map with a tileset that shows English names
+        m = folium.Map(location=[54.5260, 15.2551], zoom_start=3, tiles="CartoDB Positron")
+
+        # Create a color scale
+        colormap = branca_colormap.linear.Blues_09.scale(min(belief_data.values()), max(belief_data.values()))
+
+        # Add choropleth layer to shade entire countries
+        choropleth = folium.Choropleth(
+            geo_data=geojson_data,
+            name="choropleth",
+            data=data_latest,
+            columns=["Country", "Belief (%)"],
+            key_on="feature.properties.name",
+            fill_color="RdYlGn",
+            fill_opacity=0.7,
+            line_opacity=0.2,
+            legend_name="% Belief in Climate Change as a Serious Threat"
+        ).add_to(m)
+
+        # Add tooltips to show country name and belief percentage
+        folium.GeoJson(
+            geojson_data,
+            tooltip=folium.GeoJsonTooltip(
+                fields=["name", "Belief (%)"],
+                aliases=["Country: ", "Belief (%): "],
+                localize=True
+            )
+        ).add_to(m)
+
+        # Display the map in Streamlit
+        st.components.v1.html(m._repr_html_(), height=600)
+
+    st.header("Which sustainable solutions are most relevant for each European country? 🌍")
+    st.subheader("European Sustainability Preferences - 2009 Eurobarometer")
+
+
+    # Convert from ISO 2 to ISO 3 with the precomputed country code table (see country_codes.py)
+    df_euro["Country_code"] = iso2_to_iso3(df_euro["Country_code"])
+
+    # Color map for preferences
+    color_map = {
+        "Buying products produced by eco friendly production": "#F07167",
+        "Buying energy efficient home appliances": "#0081A7",
+        "Minimizing waste and recycling": "#00AFB9",
+        "Travelling less and adopting sustainable modes of transport": "#FED9B7",
+        "DK/NA": "#FFA500",
+    }
+
+    #section main globe
+    fig_map = px.choropleth(
+        df_euro,
+        locations="Country_code",
+        locationmode="ISO-3",
+        color="top_preference",
+        hover_name="Country_code",
+        hover_data=["top_preference"],
+        color_discrete_map=color_map,
+        projection="orthographic",
+    )
+
+    fig_map.update_layout(
+        geo=dict(
+            showcoastlines=True,
+            showland=True,
+            landcolor="lightgray",
+            coastlinecolor="lightgrey",
+            projection_type="orthographic",
+            center={"lat": 55, "lon": 10},
+            lonaxis_range=[-25, 45],
+            lataxis_range=[35, 70],
+            showlakes=True,
+            lakecolor="darkgrey",
+        ),
+        margin={"r": 0, "t": 30, "l": 0, "b": 0},
+    )
+
+    st.plotly_chart(fig_map, use_container_width=True)
+
+    # --- COUNTRY-SPECIFIC DETAILS (TWO COLUMNS BELOW) ---
+    st.subheader(" Get Country-Specific Insights! 🔎")
+
+    # Pre-load the flags of all selectable countries, optionally refreshing them from RestCountries in the background
+    euro_country_codes = df_euro["Country_code"].dropna().unique()
+    warm_flags(euro_country_codes)
+    if os.environ.get("FLAGS_BACKGROUND_REFRESH"):
+        refresh_flags_async(euro_country_codes)
+
+    selected_country_code = st.selectbox("Select a country:", euro_country_codes)
+
+    selected_data = df_euro[df_euro["Country_code"] == selected_country_code]
+    if selected_data.empty:
+        st.warning("No data available for this country.")
+    else:
+        selected_data = selected_data.iloc[0]
+        country_name = iso3_to_name(pd.Series([selected_country_code]), "Unknown Country")[0]
+        
+        # Get the flag from the bundled flag store (see flag_store.py)
+        flag_url = flag_data_uri(selected_country_code)
+        
+        col1, col2 = st.columns([1, 1])  # Two equal columns
+        
+        with col1:
+            with col1:
+                explanation_text = selected_data.get("explanation", "No explanation available.")
+            
+            st.markdown(
+                f"""
+                <div style="background-color: #f5f5f5; padding: 25px; border-radius: 15px; text-align: center;
+                    box-shadow: 3px 3px 12px rgba(0,0,0,0.1);">
+                    <h2 style="display: inline-block; margin-right: 10px;">{country_name}</h2>
+                    {'<img src=' + flag_url + ' width=80 style="vertical-align: middle;">' if flag_url else '🚩 Flag not available'}
+                    <p style="margin-top: 10px; font-size: 16px;">{explanation_text}</p>
+                </div>
+                """,
+                unsafe_allow_html=True
+            )
+        
+        with col2:
+            # Data preparation
+            preference_data = pd.DataFrame({
+                "Preference": [selected_data["top_preference"], selected_data["top2_preference"]],
+                "Percentage": [selected_data["rate_toppreference"], selected_data["ratetop2_preference"]]
+            })
+
+            # Display the top preference and percentage using st.metric
+            st.metric(label="Top Sustainability Preference", value=preference_data['Preference'][0], delta=f"{preference_data['Percentage'][0]}%")
+
+            # Display the second preference and percentage using st.metric
+            st.metric(label="Second Sustainability Preference", value=preference_data['Preference'][1], delta=f"{preference_data['Percentage'][1]}%")
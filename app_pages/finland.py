@@ -0,0 +1,534 @@
+import streamlit as st
+import pandas as pd
+
+from data_loader import load_table, table_version
+from data_schema import apply_global_data_schema, apply_timeseries_schema
+from lazy_imports import lazy_import
+from partitions import cached_partitions, get_partition
+from renewables_store import EU27_COUNTRIES, available_years, year_slice, country_slice
+
+alt = lazy_import('altair')
+px = lazy_import('plotly.express')
+go = lazy_import('plotly.graph_objects')
+
+# Country and year the energy section opens with; its written commentary is about this selection
+ENERGY_DEFAULT_COUNTRY = 'Finland'
+ENERGY_DEFAULT_YEAR = 2020
+ENERGY_SOURCE_NAMES = {'Renewables': 'renewable sources', 'Fossil Fuels': 'fossil fuels', 'Nuclear': 'nuclear energy'}
+
+
+def ordinal(n):
+    """Returns 1st, 2nd, 3rd, 4th, ... 11th, 12th, 13th, 21st, ..."""
+    suffix = 'th' if 10 <= n % 100 <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
+    return f"{n}{suffix}"
+
+
+def eu27_rank(energy_df, column, country):
+    """Rank of a country among the EU-27 countries in energy_df (1 = highest value), None without data."""
+    ranks = energy_df.set_index('entity')[column].rank(ascending=False, method='min')
+    rank = ranks.get(country)
+    return None if rank is None or pd.isna(rank) else int(rank)
+
+
+def load_data():
+    """Datasets used by this page, parsed once per process (see data_loader.py)."""
+    return {
+        'df': load_table('global_data_new.csv', apply_global_data_schema),
+        'timeseries_df': load_table('whr_timeseries.csv', apply_timeseries_schema, index_col=0),
+        'version': table_version('global_data_new.csv'),
+    }
+
+
+def render(data):
+    df = data['df']
+    timeseries_df = data['timeseries_df']
+    partitions = cached_partitions(df, version=data['version'])
+    finland_data = df.loc['FIN']
+
+    st.title("Why is Finland so happy? Exploring sustainability's role")
+    st.markdown("""
+    <span style='background-color: LemonChiffon;'>Finland consistently ranks as the happiest country in the world.</span> This dashboard explores the 
+    factors contributing to Finland's happiness, with a focus on sustainable practices.
+    """, unsafe_allow_html=True)
+
+    # Extract relevant metrics
+    happiness_score = finland_data['happiness_score']
+    sdgi = finland_data['sdgi']
+    hdi = finland_data['hdi']
+    gdp = finland_data['per_capita_gdp']
+
+
+    # Display key metrics
+    st.header("Key Metrics for Finland in 2023")
+    col1, col2, col3, col4 = st.columns(4)
+
+    col1.metric("Happiness Score", f"{happiness_score:.2f}", "Rank: #1")
+    col2.metric("SDGI (Sustainable Development Goals Index)", f"{sdgi:.2f}", "Rank: #1")
+    col3.metric("HDI", f"{hdi:.2f}", "Rank #7")
+    col4.metric("GDP per capita", f"${int(gdp):,}", "Rank #16")
+
+    st.markdown("**In 2023, Finland ranked #1 globally in both Happiness and the SDGI**, reflecting its strong quality of life and sustainability efforts. However, its lower (but still relatively high) rankings in HDI and GDP per capita suggest that the correlations between happiness and economic indicators might be weaker in comparison with sustainability indicators.")
+
+    # Display the dataset
+    st.header("Happiness Score Time Series for the Top 3 Countries")
+
+    # Select the top 3 countries based on their average happiness score
+    top_3_countries = timeseries_df.mean(axis=1).nlargest(3).index.tolist()
+
+    # Filter the dataframe for the top 3 countries
+    top_3_df = timeseries_df.loc[top_3_countries]
+
+    # Transpose the DataFrame for Plotly
+    top_3_df_t = top_3_df.T.reset_index()
+    top_3_df_t = top_3_df_t.melt(id_vars='index', var_name='Country', value_name='Happiness Score')
+
+    # Define a color mapping, explicitly setting Finland to red
+    color_map = {
+        top_3_countries[0]: 'red',    # Finland
+        top_3_countries[1]: 'lightgreen',  # Second country
+        top_3_countries[2]: 'lightblue'    # Third country
+    }
+
+    # Create an interactive plot for the time series
+    fig = px.line(
+        top_3_df_t,
+        x='index',
+        y='Happiness Score',
+        color='Country',
+        color_discrete_map=color_map,  # Apply the color map
+        labels={'index': 'Year'}
+    )
+
+    # Display the plot
+    st.plotly_chart(fig)
+
+    st.write("Finland has consistently ranked 1st in the Global Happiness Report since 2018, consistently outperforming other happy Nordic countries like Denmark and Iceland. ")
+
+    st.header("But what is the reason for it?")
+    st.markdown("Some articles point to sustainable factors like proximity of nature or unpolluted air. [[source](https://www.businessfinland.com/press-release/2024/why-is-finland-the-happiest-country-in-the-world-for-the-7th-time/)] We'll see if data matches those assumptions comparing Finland's sustainable efforts to similar EU-27 countries.")
+    st.header("Proximity to nature")
+    st.text("To analyze proximity to nature, many different factors can be taken into consideration. We'll have a look at forest land biocapacity and total biocapacity (measured in global hectares per person).")
+
+    # Countries with 'region_x' = 'EU-27'
+    eu27_countries = get_partition(partitions, 'region_x', 'EU-27')
+
+    col1, col2 = st.columns(2)
+    with col1:
+        # Get the top 5 countries by forest_land
+        top_countries_eu27 = eu27_countries.sort_values(by='forest_land', ascending=False).head(5)
+        # Add a column to identify Finland for custom coloring
+        top_countries_eu27['Color'] = top_countries_eu27['country'].apply(lambda x: 'Finland' if x == 'Finland' else 'Other')
+
+        # Create an Altair bar chart
+        bar_chart = alt.Chart(top_countries_eu27).mark_bar().encode(
+            x=alt.X('country:N', sort='-y', title='Country'),
+            y=alt.Y('forest_land:Q', title='Forest Land'),
+            color=alt.Color('Color:N', legend=None, scale=alt.Scale(domain=['Finland', 'Other'], range=['#d62728', 'lightgreen'])),
+            tooltip=['country', 'forest_land']
+        ).properties(
+            title='Top 5 Countries by Forest Land in EU-27',
+            width=700,
+            height=400
+        ).configure_axis(
+            labelFontSize=12,
+            titleFontSize=14
+        ).configure_title(
+            fontSize=16,
+            anchor='start',
+            color='black'
+        )
+
+        # Display the bar chart in Streamlit
+        st.altair_chart(bar_chart, use_container_width=True)
+    with col2:
+        # Get the top 5 countries by total_biocapacity
+        top_countries_eu27 = eu27_countries.sort_values(by='total_biocapacity', ascending=False).head(5)
+        top_countries_eu27['Color'] = top_countries_eu27['country'].apply(lambda x: 'Finland' if x == 'Finland' else 'Other')
+        # Create an Altair bar chart
+        bar_chart = alt.Chart(top_countries_eu27).mark_bar().encode(
+            x=alt.X('country:N', sort='-y', title='Country'),
+            y=alt.Y('total_biocapacity:Q', title='Total Biocapacity'),
+            color=alt.Color('Color:N', legend=None, scale=alt.Scale(domain=['Finland', 'Other'], range=['#d62728', 'lightgreen'])),
+            tooltip=['country', 'total_biocapacity']
+        ).properties(
+            title='Top 5 Countries by Total Biocapacity in EU-27',
+            width=700,
+            height=400
+        ).configure_axis(
+            labelFontSize=12,
+            titleFontSize=14
+        ).configure_title(
+            fontSize=16,
+            anchor='start',
+            color='black'
+        )
+
+        # Display the bar chart in Streamlit
+        st.altair_chart(bar_chart, use_container_width=True)
+
+    st.markdown("**Finland ranks first among EU-27 countries in terms of forest land and total biocapacity, emphasizing its deep connection to nature.**") 
+    
+    st.header("Clean Energy")
+
+    st.text("To assess Finland's performance in electricity production, we will examine the total renewable electricity in TWh generated by EU-27 countries (solar, biomass, wind, and hydroelectric power).")
+
+    # Year and country selection, served from the (country, year) indexed renewables store
+    renewables_years = available_years()
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        energy_year = st.slider("Year", min_value=renewables_years[0], max_value=renewables_years[-1], value=ENERGY_DEFAULT_YEAR)
+    with col2:
+        energy_country = st.selectbox("Country", EU27_COUNTRIES, index=EU27_COUNTRIES.index(ENERGY_DEFAULT_COUNTRY))
+    is_default_selection = (energy_country, energy_year) == (ENERGY_DEFAULT_COUNTRY, ENERGY_DEFAULT_YEAR)
+
+    # EU-27 countries in the selected year
+    energy_df = year_slice(energy_year, EU27_COUNTRIES).reset_index()
+
+    # Get the top 10 countries by renewables
+    top_countries_eu27 = energy_df.sort_values(by='electricity_from_renewables_twh', ascending=False).head(10)
+
+    # Add a new column to identify if the country is the selected one
+    top_countries_eu27['highlight'] = top_countries_eu27['entity'].apply(lambda x: 'red' if x == energy_country else 'muted_blue')
+
+    # Create an Altair bar chart
+    bar_chart = alt.Chart(top_countries_eu27).mark_bar().encode(
+        x=alt.X('entity:N', sort='-y', title='Country'),
+        y=alt.Y('electricity_from_renewables_twh:Q', title='Electricity from Renewables (TWh)'),
+        color=alt.Color('highlight:N', legend=None, 
+                        scale=alt.Scale(domain=['red', 'muted_blue'], range=['red', 'lightblue'])),
+        tooltip=['entity', 'electricity_from_renewables_twh']
+    ).properties(
+        title=f'Top 10 Countries by Electricity from Renewables in EU-27, {energy_year}',
+        width=700,
+        height=400
+    ).configure_axis(
+        labelFontSize=12,
+        titleFontSize=14
+    ).configure_title(
+        fontSize=16,
+        anchor='start',
+        color='black'
+    )
+
+    # Display the bar chart in Streamlit
+    st.altair_chart(bar_chart, use_container_width=True)
+
+    # Rank of the selected country in the selected year
+    renewables_rank = eu27_rank(energy_df, 'electricity_from_renewables_twh', energy_country)
+    closer_look = "<span style='background-color: LemonChiffon;'>a closer examination of the percentage share of different energy sources may provide more valuable insights.</span>"
+    if renewables_rank is None:
+        st.markdown(f"There is no data on the renewable electricity production of {energy_country} in {energy_year}.")
+    elif renewables_rank == 1:
+        st.markdown(f"{energy_country} ranks 1st among EU-27 countries in terms of total renewable electricity production in {energy_year}, but {closer_look}", unsafe_allow_html=True)
+    else:
+        st.markdown(f"Although {energy_country} does not rank 1st in terms of total renewable electricity production (ranking {ordinal(renewables_rank)}), {closer_look}", unsafe_allow_html=True)
+    st.subheader(f"Energy in {energy_country} by source ({energy_year})")
+    col1, col2 = st.columns(2)
+    
+    # Look up the selected country and year in the indexed store
+    country_energy = country_slice(energy_country).loc[energy_year]
+
+    # Calculate the components of electricity production
+    electricity_from_renewables = country_energy['electricity_from_renewables_twh']
+    electricity_from_fossil = country_energy['electricity_from_fossil_fuels_twh']
+    electricity_from_nuclear = country_energy['electricity_from_nuclear_twh']
+
+    # Calculate the total electricity production
+    total_electricity = electricity_from_renewables + electricity_from_fossil + electricity_from_nuclear
+
+    # Calculate percentages for the pie chart
+    data = pd.DataFrame({
+        'Source': ['Renewables', 'Fossil Fuels', 'Nuclear'],
+        'Electricity (TWh)': [electricity_from_renewables, electricity_from_fossil, electricity_from_nuclear],
+        'Percentage': [
+            (electricity_from_renewables / total_electricity) * 100,
+            (electricity_from_fossil / total_electricity) * 100,
+            (electricity_from_nuclear / total_electricity) * 100
+        ]
+    })
+
+    # Create the pie chart
+    pie_chart = alt.Chart(data).mark_arc(innerRadius=50).encode(
+        theta=alt.Theta(field="Electricity (TWh)", type="quantitative"),
+        color=alt.Color(
+            'Source:N',
+            scale=alt.Scale(
+                domain=['Renewables', 'Fossil Fuels', 'Nuclear'],
+                range=['#2ca02c', '#ff7f0e', '#1f77b4']  # Green for renewables, orange for fossil, blue for nuclear
+            )
+        ),
+        tooltip=[
+            alt.Tooltip('Source:N', title='Source'),
+            alt.Tooltip('Electricity (TWh):Q', title='Electricity (TWh)', format=',.2f'),
+            alt.Tooltip('Percentage:Q', title='Percentage', format='.2f')
+        ],
+        text=alt.Text('Percentage:Q', format='.1f')  # Show percentage on the pie slices
+    ).properties(
+        width=400,
+        height=300
+    ).configure_title(
+        fontSize=16,
+        anchor='start',
+        color='black'
+    ).configure_view(
+        strokeOpacity=0  # Remove stroke around the pie chart
+    )
+
+    # Display the pie chart and metrics in Streamlit
+    cola, colb = st.columns([2, 1])
+
+    with cola:
+        # Displaying metrics in columns
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Renewables", f"{data[data['Source'] == 'Renewables']['Percentage'].values[0]:.1f}%", "Green Energy")
+        col2.metric("Nuclear Energy", f"{data[data['Source'] == 'Nuclear']['Percentage'].values[0]:.1f}%", "Low Carbon")
+        col3.metric("Fossil Fuels", f"{data[data['Source'] == 'Fossil Fuels']['Percentage'].values[0]:.1f}%", "Non-Renewable")
+        
+        # Explanatory text below the metrics
+        if is_default_selection:
+            st.markdown("""
+            <span style='background-color: LemonChiffon;'>Finland's electricity production is primarily powered by renewable sources,</span> with a significant share coming from wind, solar, and bioenergy. 
+            Nuclear energy also plays a crucial role in the country's low-carbon energy mix. However, fossil fuels still account for a portion of the electricity generation,
+            reflecting the country's ongoing transition towards more sustainable energy solutions.
+            """, unsafe_allow_html=True)
+        elif data['Percentage'].notna().any():
+            shares = data.set_index('Source')['Percentage'].sort_values(ascending=False)
+            main, second, third = [(ENERGY_SOURCE_NAMES[source], share) for source, share in shares.items()]
+            st.markdown(
+                f"<span style='background-color: LemonChiffon;'>In {energy_year}, {energy_country}'s electricity production was primarily powered by {main[0]}</span> "
+                f"({main[1]:.1f}%), followed by {second[0]} ({second[1]:.1f}%) and {third[0]} ({third[1]:.1f}%).",
+                unsafe_allow_html=True
+            )
+
+    with colb:
+        # Display the pie chart in Streamlit
+        st.altair_chart(pie_chart)
+
+    st.subheader("Energy consumption")
+        # Filter relevant columns for visualization
+    energy_consumption_df = energy_df[['entity', 'primary_energy_consumption_per_capita_kwhperson']]
+
+    # Sort the values by primary energy consumption per capita in descending order and take the top 10
+    top_10_energy_consumption_df = energy_consumption_df.sort_values(by='primary_energy_consumption_per_capita_kwhperson', ascending=False).head(10)
+
+    # Add a column to identify the selected country for custom coloring
+    top_10_energy_consumption_df['Color'] = top_10_energy_consumption_df['entity'].apply(lambda x: x if x == energy_country else 'Other')
+
+    # Create a bar chart
+    bar_chart = alt.Chart(top_10_energy_consumption_df).mark_bar().encode(
+        x=alt.X('primary_energy_consumption_per_capita_kwhperson:Q', title='Primary Energy Consumption per Capita (kWh)'),
+        y=alt.Y('entity:N', sort='-x', title='Country'),
+        color=alt.Color('Color:N', scale=alt.Scale(domain=[energy_country, 'Other'], range=['red', 'lightblue'])),  # Red for the selected country, muted for others
+        tooltip=[
+            alt.Tooltip('entity:N', title='Country'),
+            alt.Tooltip('primary_energy_consumption_per_capita_kwhperson:Q', title='Consumption (kWh)', format='.2f')
+        ]
+    ).properties(
+        title=f"Top 10 Countries by Primary Energy Consumption per Capita in EU-27, {energy_year}",
+        width=700,
+        height=400
+    ).configure_title(
+        fontSize=16,
+        anchor='start',
+        color='black'
+    )
+
+    # Display the bar chart in Streamlit
+    st.altair_chart(bar_chart, use_container_width=True)
+
+    consumption_rank = eu27_rank(energy_df, 'primary_energy_consumption_per_capita_kwhperson', energy_country)
+    if is_default_selection:
+        st.markdown("**Although coming mostly from renewable sources, energy consumption measured per capita in Finland is quite high, ranking 6th in Euro-27 countries.**")
+    elif consumption_rank is not None:
+        st.markdown(f"**In {energy_year}, energy consumption measured per capita in {energy_country} ranks {ordinal(consumption_rank)} in Euro-27 countries.**")
+
+    st.header("Plastic waste management")
+    st.text("A look into country's waste production and management can give us insights into it's sustainable practices. We'll inspect Finland's per capita plastic waste production and the rate of recycling.")
+    col1, col2 = st.columns(2)
+
+    with col1:
+
+        # Countries in the EU-27 region
+        eu27_waste_df = eu27_countries[['country', 'per_capita_waste_kg']]
+
+        # Sort the values by per capita waste in ascending order and take the top 20
+        top_20_eu27_waste_df = eu27_waste_df.sort_values(by='per_capita_waste_kg', ascending=False).head(20)
+
+        # Add a column to identify Finland for custom coloring
+        top_20_eu27_waste_df['Color'] = top_20_eu27_waste_df['country'].apply(lambda x: 'Finland' if x == 'Finland' else 'Other')
+        # Calculate the average per capita waste for EU-27
+        eu27_avg_waste = eu27_waste_df['per_capita_waste_kg'].mean()
+        # Create a vertical bar chart for per capita waste
+        bar_chart_eu27_waste = alt.Chart(top_20_eu27_waste_df).mark_bar().encode(
+            y=alt.Y('country:N', sort='-x', title='Country'),
+            x=alt.X('per_capita_waste_kg:Q', title='Per Capita Waste (kg)'),
+            color=alt.Color('Color:N', scale=alt.Scale(domain=['Finland', 'Other'], range=['#d62728', 'lightgray'])),  # Red for Finland
+            tooltip=[
+                alt.Tooltip('country:N', title='Country'),
+                alt.Tooltip('per_capita_waste_kg:Q', title='Per Capita Waste (kg)', format='.2f')
+            ]
+        )
+
+        # Add the vertical line for EU-27 average waste
+        line_avg = alt.Chart(pd.DataFrame({'x': [eu27_avg_waste]})).mark_rule(color='black').encode(
+        x='x:Q'
+        )
+
+        # Layer the bar chart and vertical line together using alt.layer
+        final_chart = alt.layer(bar_chart_eu27_waste, line_avg).properties(
+            title="Top 20 EU-27 Countries by Per Capita Plastic Waste",
+            width=700,
+            height=400
+        ).configure_axis(
+            labelFontSize=12,
+            titleFontSize=14
+        )
+
+        # Display the bar chart with full container width
+        st.altair_chart(final_chart, use_container_width=True)
+
+
+        finland_waste = eu27_waste_df.loc['FIN', 'per_capita_waste_kg']
+
+        # Display the EU-27 average per capita waste as a metric
+        cola, colb = st.columns(2)
+        with cola:
+            st.metric("EU-27 Average Per Capita Waste", f"{eu27_avg_waste:.2f} kg")
+        with colb:
+            st.metric("Finland's Per Capita Waste", f"{finland_waste:.2f} kg")
+
+        st.text("Finland ranks 9th in plastic waste production per capita among EU-27 countries, and it's only slightly under average.")
+
+    with col2:
+        # Countries in the EU-27 region
+        eu27_recycling_rate_df = eu27_countries[['country', 'recycling_rate']]
+
+        # Sort the values by recycling rate in descending order and take the top 20
+        top_20_eu27_recycling_rate_df = eu27_recycling_rate_df.sort_values(by='recycling_rate', ascending=False).head(20)
+
+        # Add a column to identify Finland for custom coloring
+        top_20_eu27_recycling_rate_df['Color'] = top_20_eu27_recycling_rate_df['country'].apply(lambda x: 'Finland' if x == 'Finland' else 'Other')
+        
+        # Calculate the average recycling rate for EU-27
+        eu27_avg_recycling_rate = eu27_recycling_rate_df['recycling_rate'].mean()
+       
+        # Create a vertical bar chart for recycling rate
+        bar_chart_eu27_recycling = alt.Chart(top_20_eu27_recycling_rate_df).mark_bar().encode(
+            y=alt.Y('country:N', sort='-x', title='Country'),
+            x=alt.X('recycling_rate:Q', title='Recycling Rate (%)'),
+            color=alt.Color('Color:N', scale=alt.Scale(domain=['Finland', 'Other'], range=['#d62728', 'lightgray'])),  # Red for Finland, muted blue for others
+            tooltip=[
+                alt.Tooltip('country:N', title='Country'),
+                alt.Tooltip('recycling_rate:Q', title='Recycling Rate (%)', format='.2f')
+            ]
+        )
+
+        # Add the vertical line for EU-27 average waste
+        line_avg = alt.Chart(pd.DataFrame({'x': [eu27_avg_recycling_rate]})).mark_rule(color='black').encode(
+        x='x:Q'
+        )
+
+        # Layer the bar chart and vertical line together using alt.layer
+        final_chart = alt.layer(bar_chart_eu27_recycling, line_avg).properties(
+            title="Top 20 EU-27 Countries by Per Capita Recycling Rate",
+            width=700,
+            height=400
+        ).configure_axis(
+            labelFontSize=12,
+            titleFontSize=14
+        )
+
+        # Display the bar chart with full container width
+        st.altair_chart(final_chart, use_container_width=True)
+        # Calculate Finland's per capita waste
+        finland_rec = eu27_recycling_rate_df.loc['FIN', 'recycling_rate']
+
+        cola, colb =  st.columns(2)
+        # Display the EU-27 average recycling rate as a metric
+        with cola:
+            st.metric("EU-27 Average Recycling Rate", f"{eu27_avg_recycling_rate:.2f}%")
+        with colb:
+            st.metric("Finland's Recycling Rate", f"{finland_rec:.2f} %")
+
+        st.text("Finland's average recycling rate is about 5 p.p. higher than EU-27's average and it ranks on the 10th place among those countries.")
+
+    st.markdown("""**To sum up, Finalnd's plastic waste management does not significantly deviate from EU's average.**""")
+
+    st.header("Other factors")
+    col1, col2 = st.columns(2)
+    with col1:
+
+        category_labels = {
+            'social_support': 'Social Support',
+            'healthy_life_expectancy': 'Healthy Life Expectancy',
+            'freedom_to_make_life_choices': 'Freedom to Make Life Choices',
+            'generosity': 'Generosity',
+            'perceptions_of_corruption': 'Perceptions of Corruption'
+        }
+
+        # Columns to include in the radar chart
+        categories = list(category_labels.keys())
+
+        # Normalize Finland's values by the maximum value of each column
+        values = (df.loc['FIN', categories] / df[categories].max()).astype(float).tolist()
+
+        # Close the radar chart by repeating the first value
+        values += values[:1]
+        labels = [category_labels[cat] for cat in categories] + [category_labels[categories[0]]]
+
+        # Create a radar chart
+        fig = go.Figure()
+        fig.add_trace(go.Scatterpolar(
+            r=values,
+            theta=labels,
+            fill='toself',
+            name='Finland',
+            line_color='rgba(235, 206, 235, 1)',  # Muted blue for the line
+            fillcolor='rgba(235, 206, 235, 0.5)'  # Muted blue with transparency for fill
+        ))
+
+        # Update layout
+        fig.update_layout(
+            polar=dict(
+                radialaxis=dict(
+                    visible=True,
+                    range=[0, 1]  # Normalized scale from 0 to 1
+                )
+            ),
+            title="Radar Chart: Finland's Scores (Normalized to Max Values)",
+            showlegend=False
+        )
+
+        # Display the radar chart in Streamlit
+        st.plotly_chart(fig)
+
+    with col2:    
+        st.markdown(
+            """
+            <div style="margin: 50px 0;">
+                When we take into consideration <b> other categories, that are not directly related to sustainability,</b> 
+                <span style='background-color: LemonChiffon;'>Finland scores high in metrics measuring social support, healthy life expectancy, 
+                freedom to make life choices, and perceptions of corruption.</span> These factors might also influence happiness of Finnish citizens. 
+                Generosity, in contrast, is comparatively lower, indicating it may play a less prominent role in the broader context of happiness.
+                <br><br>
+
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+
+    st.header("Conclusion")
+    st.markdown("""<span style='background-color: LemonChiffon;'>The link between Finland's sustainable practices and the happiness of its citizens is not entirely clear. </span>
+    While Finland has abundant forests and relies heavily on renewable and nuclear energy, **these factors alone do not fully explain its high happiness rankings.**
+    For example, Finland's performance in plastic waste management is fairly average compared to other European countries. It’s likely that other factors, 
+    such as income, healthcare, and cultural influences, play a larger role in determining happiness. **More research is needed to understand how environmental 
+    efforts might contribute to well-being alongside these other factors.**""", unsafe_allow_html=True)
+
+    st.header("Data Sources")
+    st.markdown("""
+                1. [World Happiness Report 2023](https://www.kaggle.com/datasets/sazidthe1/global-happiness-scores-and-factors?select=WHR_2023.csv)
+                2. [Global Ecological Footprint 2023](https://www.kaggle.com/datasets/jainaru/global-ecological-footprint-2023)
+                3. [Global Plastic Waste 2023](https://www.kaggle.com/datasets/prajwaldongre/global-plastic-waste-2023-a-country-wise-analysis)
+                4. [Global Data on Sustainable Energy 2020](https://www.kaggle.com/datasets/anshtanwar/global-data-on-sustainable-energy)
+    
+    """)
@@ -0,0 +1,449 @@
+import numpy as np
+import streamlit as st
+
+from correlations import build_heatmap, cached_correlation_table, correlation
+from data_loader import load_table, table_version
+from data_schema import apply_global_data_schema
+from figure_cache import cached_figure
+from lazy_imports import lazy_import
+from metric_arrays import cached_metric_arrays, pair_values
+from regression import cached_fit_pairs, trendline
+
+px = lazy_import('plotly.express')
+go = lazy_import('plotly.graph_objects')
+
+# (x, y) pairs drawn with a trendline on this page, all fitted in one batched pass
+OVERALL_PAIRS = [
+    ('sdgi', 'happiness_score'),
+    ('per_capita_gdp', 'happiness_score'),
+    ('hdi', 'happiness_score'),
+    ('recycling_rate', 'happiness_score'),
+    ('forest_land', 'happiness_score'),
+    ('per_capita_waste_kg', 'happiness_score'),
+    ('carbon_footprint', 'happiness_score'),
+]
+
+TRENDLINE_POINTS = 50  # points the trendline and its confidence band are drawn with
+
+INCOME_GROUP_COLORS = {
+    'LI' : '#9b5de5',
+    'LM' : '#f15bb5',
+    'UM' : '#fee440',
+    'HI' : '#00f5d4',
+}
+
+# Display names of metrics, also the metrics shown in the correlation heatmap
+METRIC_LABELS = {
+    'happiness_score': 'Happiness Score',
+    'sdgi': 'SDGI',
+    'hdi': 'HDI',
+    'per_capita_gdp': 'GDP per capita',
+    'recycling_rate': 'Recycling Rate',
+    'forest_land': 'Forest Land',
+    'per_capita_waste_kg': 'Per capita plastic waste',
+    'carbon_footprint': 'Carbon Footprint',
+    'total_biocapacity': 'Total Biocapacity',
+}
+INCOME_GROUP_NAMES = {'all': 'All countries', 'LI': 'Low Income', 'LM': 'Lower Middle Income', 'UM': 'Upper Middle Income', 'HI': 'High Income'}
+
+# Metrics compared with happiness in every income group, with the findings shown below them
+METRIC_NOTES = {
+    'recycling_rate': "The results show that depending on income level of a country, <span style='background-color: LemonChiffon;'>recycling rate can be either positivey or negatively correlated.</span>",
+    'carbon_footprint': "In case of total carbon footprit, it seems that its correlation with happines <span style='background-color: LemonChiffon;'>decreses as income status increases.</span>",
+    'total_biocapacity': "Total biocapacity of a country seems to be <span style='background-color: LemonChiffon;'>irrelevant for low and middle income countries</span>, and <span style='background-color: LemonChiffon;'>correlate positively with happiness for high income countries.</span>",
+}
+
+
+def metric_label(column):
+    return METRIC_LABELS.get(column, column.replace('_', ' ').capitalize())
+
+
+def load_data():
+    """Datasets used by this page, parsed once per process (see data_loader.py)."""
+    return {
+        'df': load_table('global_data_new.csv', apply_global_data_schema),
+        'version': table_version('global_data_new.csv'),
+    }
+
+
+def display_world_average(df, column):
+    # Calculate the average SDGI score
+    world_average = df[column].mean()
+
+    # Display the average score
+    st.metric("World Average:", f"{world_average:.2f}")
+
+def display_country_count(df, column):
+    """
+    Displays the count of countries with data for the specified column.
+    
+    Parameters:
+    df (DataFrame): Data containing the country information and numerical data.
+    column (str): The column to check for non-null values.
+    """
+    # Calculate the number of countries with non-null data in the specified column
+    countries_with_data = df[df[column].notnull()].index.nunique()
+    
+    # Display the count as a metric
+    st.metric("Countries with data: ", f"{countries_with_data:,}")
+
+def display_top_three(df, column):
+    # Get the top 3 rows
+    top_countries = df.nlargest(3, column)['country'].tolist()
+
+    # Format the countries with their ranks
+    formatted_countries = ", ".join([f"{i+1}. {country}" for i, country in enumerate(top_countries)])
+
+    # Display the result
+    st.metric("Top 3 countries:", formatted_countries)
+
+def build_map(df, column, fill_color, min, max):
+    # dataframe, numerical data column, color scheme, minimal value in column, max value in column 
+    # Create the choropleth map
+    fig = go.Figure(data=go.Choropleth(
+        locations=df.index,                  # Country ISO codes (index of the dataset)
+        z=df[column],            
+        text=df['country'],                  # Country names for hover text
+        marker_line_color='darkgray',         # Country borders
+        marker_line_width=0.5,                # Border width
+        coloraxis="coloraxis"                 # Reference to the coloraxis
+    ))
+
+    # Update layout
+    fig.update_layout(
+        geo=dict(
+            showframe=False,                
+            showcoastlines=False,              
+            projection_type='equirectangular',  
+            showland=True,
+            landcolor='lightgray',
+            fitbounds="locations",
+            uirevision='constant'
+        ),
+        coloraxis=dict(
+            colorscale=fill_color,
+            colorbar_len = 0.5,
+            colorbar=dict(
+                tickmode = 'auto'
+            ),
+            cmin = min,
+            cmax = max,
+        ),
+        dragmode=False,  # Disable dragging and panning
+        margin=dict(t=0, b=0, l=0, r=0)
+    )
+
+    return fig
+
+def display_map(df, column, fill_color, min, max, version=None):
+    # The map only depends on static data, so with a dataset version it is built once per process
+    if version is None:
+        fig = build_map(df, column, fill_color, min, max)
+    else:
+        key = ('choropleth', version, column, fill_color, min, max)
+        fig = cached_figure(key, lambda: build_map(df, column, fill_color, min, max))
+
+    # Display the map
+    st.plotly_chart(fig, use_container_width=True)
+
+def add_trendline(fig, fit, x_values):
+    """
+    Adds the regression line of a fit (a row of regression.fit_pairs()) over the range
+    of x_values, with the 95% confidence band of the line.
+    """
+    x_values = np.asarray(x_values, dtype='float64')
+    x_values = x_values[~np.isnan(x_values)]
+    if fit['n'] < 2 or x_values.size == 0:
+        return
+    # The band is curved, so evaluate it at enough points to draw it smoothly
+    line = trendline(fit, np.linspace(x_values.min(), x_values.max(), TRENDLINE_POINTS))
+
+    # Lower bound first, the upper bound is filled down to it
+    fig.add_trace(go.Scatter(
+        x=line['x'], y=line['lower'], mode='lines', line=dict(width=0),
+        showlegend=False, hoverinfo='skip',
+    ))
+    fig.add_trace(go.Scatter(
+        x=line['x'], y=line['upper'], mode='lines', line=dict(width=0),
+        fill='tonexty', fillcolor='rgba(169, 169, 169, 0.25)',
+        showlegend=False, hoverinfo='skip',
+    ))
+    fig.add_trace(go.Scatter(
+        x=line['x'],
+        y=line['y'],
+        mode='lines',
+        line=dict(color='#A9A9A9'),
+        showlegend=False,
+        hovertemplate=(
+            f"<b>OLS trendline</b><br>y = {fit['slope']:.6g} * x + {fit['intercept']:.6g}"
+            f"<br>R<sup>2</sup>={fit['r2']:.6f}<extra></extra>"
+        ),
+    ))
+
+def create_scatterplot_per_income(data, y_value, x_value, y_title, x_title, fits):
+    # Create scatterplot with color based on income group
+    fig = px.scatter(
+        data,
+        x=x_value,
+        y=y_value,
+        hover_name='country',  # Display country names on hover
+        color='income_group',  # Color points based on 'income_group'
+        color_discrete_map=INCOME_GROUP_COLORS,
+        labels={  # Custom axis labels
+            x_value: x_title,
+            y_value: y_title,
+            'income_group': 'Income Group'
+        },
+        category_orders={'income_group': ['LI', 'LM', 'UM', 'HI']},  # Order the income group categories
+    )
+
+    # Add a single regression line for the entire dataset
+    valid = data[[x_value, y_value]].dropna()
+    add_trendline(fig, fits.loc[(x_value, y_value, 'all')], valid[x_value])
+
+    # Update layout to remove the legend and gridlines
+    fig.update_layout(
+        height=450,
+        showlegend=False,  # Hide the legend
+        plot_bgcolor='white',  # Set background to white
+        paper_bgcolor='white',  # Set the paper background to white
+        xaxis=dict(showgrid=False, zeroline=False),  # Remove x-axis gridlines
+        yaxis=dict(showgrid=False, zeroline=False)   # Remove y-axis gridlines
+    )
+
+    # Display the plot in Streamlit
+    st.plotly_chart(fig, use_container_width=True)
+
+def build_income_group_scatterplot(arrays, fits, x_value, y_value, income_group):
+    """
+    Builds the scatterplot of one income group from precomputed arrays (see metric_arrays.py).
+
+    Parameters:
+    arrays (dict): Result of metric_arrays.build_metric_arrays() split by income group.
+    fits (DataFrame): Result of regression.fit_pairs() per income group, containing (x_value, y_value).
+    x_value, y_value (str): Columns on the x and y axis.
+    income_group (str): 'LI', 'LM', 'UM' or 'HI'.
+    """
+    countries, x, y = pair_values(arrays, income_group, x_value, y_value)
+
+    fig = go.Figure(go.Scatter(
+        x=x,
+        y=y,
+        mode='markers',
+        marker=dict(color=INCOME_GROUP_COLORS[income_group]),
+        hovertext=countries,  # Display country names on hover
+        hovertemplate='<b>%{hovertext}</b><br>' + metric_label(x_value) + '=%{x}<br>' + metric_label(y_value) + '=%{y}<extra></extra>',
+    ))
+
+    # Add the regression line of the income group
+    if (x_value, y_value, income_group) in fits.index:
+        add_trendline(fig, fits.loc[(x_value, y_value, income_group)], x)
+
+    # Update layout to remove the legend and gridlines
+    fig.update_layout(
+        height=350,
+        showlegend=False,  # Hide the legend
+        plot_bgcolor='white',  # Set background to white
+        paper_bgcolor='white',  # Set the paper background to white
+        xaxis=dict(title=metric_label(x_value), showgrid=False, zeroline=False),  # Remove x-axis gridlines
+        yaxis=dict(title=metric_label(y_value), showgrid=False, zeroline=False),  # Remove y-axis gridlines
+        margin={"r": 0, "t": 30, "l": 0, "b": 0},
+    )
+    return fig
+
+def explorer_data(df, version=None):
+    """
+    Numeric columns of df, their per-income-group arrays and the regression fits of
+    every ordered pair of them per income group, computed once per dataset version.
+    """
+    metrics = list(df.select_dtypes('number').columns)
+    pairs = [(x, y) for x in metrics for y in metrics if x != y]
+    arrays = cached_metric_arrays(df, 'income_group', metrics, version=version)
+    fits = cached_fit_pairs(df, pairs, 'income_group', version=version)
+    return metrics, arrays, fits
+
+def display_income_group_row(arrays, fits, x_value, y_value, section, version=None):
+    """
+    Shows the scatterplots of x_value and y_value side by side, one per income group.
+    section names the part of the page, the same pair can be shown in more than one.
+    """
+    for column, income_group in zip(st.columns(4), INCOME_GROUP_COLORS):
+        with column:
+            build = lambda: build_income_group_scatterplot(arrays, fits, x_value, y_value, income_group)
+            if version is None:
+                fig = build()
+            else:
+                fig = cached_figure(('income_group_scatter', version, x_value, y_value, income_group), build)
+            st.plotly_chart(fig, use_container_width=True, key=f"{section}_{income_group}")
+
+def display_metric_explorer(metrics, arrays, fits, version=None):
+    """
+    Shows one scatterplot per income group for any pair of numeric columns chosen by the user.
+
+    The per-income-group arrays and the regression fits of all pairs are computed once
+    per dataset version (see explorer_data()), so changing the selection does not
+    filter the data or fit anything again.
+    """
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        x_value = st.selectbox("X axis", metrics, index=metrics.index('happiness_score'), format_func=metric_label)
+    with col2:
+        y_value = st.selectbox("Y axis", metrics, index=metrics.index('sdgi'), format_func=metric_label)
+
+    st.markdown(f"**{metric_label(y_value)} and {metric_label(x_value)}**")
+    display_income_group_row(arrays, fits, x_value, y_value, 'explorer', version)
+
+def display_correlation_heatmap(correlations, version=None):
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        method = st.radio("Correlation coefficient", ['pearson', 'spearman'], format_func=str.capitalize, horizontal=True)
+    with col2:
+        group = st.selectbox("Income group", list(INCOME_GROUP_NAMES), format_func=INCOME_GROUP_NAMES.get)
+
+    columns = list(METRIC_LABELS)
+    build = lambda: build_heatmap(correlations, method, group, columns, METRIC_LABELS)
+    if version is None:
+        fig = build()
+    else:
+        fig = cached_figure(('correlation_heatmap', version, method, group), build)
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Correlation of happiness with the SDGI for the selected group
+    pair = correlation(correlations, 'happiness_score', 'sdgi', group)
+    st.caption(f"Happiness Score and SDGI: r = {pair[f'{method}_r']:.2f}, p = {pair[f'{method}_p']:.3g}, n = {pair['n']}")
+
+
+def render(data):
+    df = data['df']
+    version = data['version']
+    overall_fits = cached_fit_pairs(df, OVERALL_PAIRS, version=version)
+    correlations = cached_correlation_table(df, group_column='income_group', version=version)
+
+    st.title(f"Global Overview - are residents of sustainable countries happier?")
+    st.markdown("""To explore the link between **sustainability and happiness**, we will first examine global trends 
+    of reported happiness and sustainability measured by SDGI. We will also consider countries of <span style='background-color: LemonChiffon;'>varying income 
+    levels</span> to take different economic contexts into consideration.""", unsafe_allow_html=True)
+
+    st.header("Global Happiness Score in 2023")
+    st.markdown("""The Happiness Score, also known as the Happiness Index, measures the well-being and life satisfaction of people across different countries. 
+    The results are based on **self-assessments of happiness, well-being, sustainability, and resilience.**""")
+    
+    display_map(df, 'happiness_score', 'YlGn', 1.86, 7.8, version)
+    
+    col1, col2, col3 = st.columns([3, 1, 1])
+    with col1:
+        display_top_three(df, 'happiness_score')
+    with col2:
+        display_world_average(df, 'happiness_score')
+    with col3:
+        display_country_count(df, 'happiness_score')
+
+    st.header("The Sustainable Development Goals Index in 2023")
+    st.markdown("""The Sustainable Development Goals Index (SDGI) measures and ranks countries' progress toward achieving [the United Nations' 17 
+    Sustainable Development Goals](https://sdgs.un.org/goals) using various performance indicators. """)
+
+    display_map(df, 'sdgi', 'YlGn', 40, 86.5, version)
+
+    col1, col2, col3 = st.columns([3, 1, 1])
+    with col1:
+        display_top_three(df, 'sdgi')
+    with col2:
+        display_world_average(df, 'sdgi')
+    with col3:
+        display_country_count(df, 'sdgi')
+
+    st.markdown("""The two maps that follow show measurements of happiness and sustainability across different nations worldwide, 
+    based on international standards. While developed countries tend to score higher on both measures, suggesting a possible relationship,  <span style='background-color: LemonChiffon;'>
+    the results are ambiguous and do not necessarily indicate causation.</span>""", unsafe_allow_html=True)
+    st.markdown("**In the next steps, we'll visualise correlations between Happines Score and SDGI and compare them to economic measures.**")
+    
+    st.header("Relation of Happiness Score and...")
+    st.markdown("""<div style='text-align: center;'>Legend: <span style='color:#9b5de5;'>⬤</span> Low Income <span style='color:#f15bb5;'>⬤</span> Lower Middle Income   <span style='color:#fee440;'>⬤</span> Lower Upper Income   <span style='color:#00f5d4;'>⬤</span> High Income
+    </div>""", unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col1:
+        st.markdown("<h3 style='text-align: center;'>SDGI</h3>", unsafe_allow_html=True)
+        create_scatterplot_per_income(df, 'happiness_score', 'sdgi', 'Happiness Score', 'SDGI', overall_fits)
+        st.markdown(""" <div style='text-align: justify;'>The Happiness Score and the <b>SDGI</b> have <span style='background-color: LemonChiffon;'>a strong correlation,
+                    suggesting sustainable practices might be linked to overall wellbeing.</span>
+        </div>""", unsafe_allow_html=True)
+    with col2:
+        st.markdown("<h3 style='text-align: center;'>GDP per capita</h33>", unsafe_allow_html=True)
+        create_scatterplot_per_income(df, 'happiness_score', 'per_capita_gdp',  'Happiness Score', 'GDP per capita', overall_fits)
+        st.markdown(""" <div style='text-align: justify;'>The Happiness Score and <b>GDP (Gross Domestic Product) per capita</b> also correlate positively, but the value of correlation coefficient is lower.
+        </div>""", unsafe_allow_html=True)
+    with col3:
+        st.markdown("<h3 style='text-align: center;'>HDI</h3>", unsafe_allow_html=True)
+        create_scatterplot_per_income(df, 'happiness_score', 'hdi', 'Happiness Score', 'HDI', overall_fits)
+        st.markdown(""" <div style='text-align: justify;'>The same holds true for <b>HDI (Human Development Index)</b> and the Happiness Score.
+        </div>""", unsafe_allow_html=True)
+    
+    st.markdown("")
+    st.markdown("""Overall, <b>SDGI shows a stronger correlation with Happiness Score than economic measures</b> such as GDP per capita or HDI. 
+                However, a country's income must be considered when analyzing these measures. 
+                <span style='background-color:#00f5d4;'>High-income countries</span> consistently outperform lower-income countries in terms of both happiness and sustainability, <b>as they have the resources to do so.</b>
+                """, unsafe_allow_html=True)
+    st.markdown("""
+                In next steps we will explore in depth what are correlations between specific practices and happiness.
+            """)
+
+    st.header("Happiness Score and (un)sustainable practices")
+    st.markdown("""<div style='text-align: center;'>Legend: <span style='color:#9b5de5;'>⬤</span> Low Income <span style='color:#f15bb5;'>⬤</span> Lower Middle Income   <span style='color:#fee440;'>⬤</span> Lower Upper Income   <span style='color:#00f5d4;'>⬤</span> High Income
+    </div>""", unsafe_allow_html=True)
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        create_scatterplot_per_income(df, 'happiness_score', 'recycling_rate', 'Happiness Score', 'Recycling Rate', overall_fits)
+    with col2:
+        create_scatterplot_per_income(df, 'happiness_score', 'forest_land', 'Happiness Score', 'Forest Land', overall_fits)
+    with col3:
+        create_scatterplot_per_income(df, 'happiness_score', 'per_capita_waste_kg', 'Happiness Score', 'Per capita plastic waste', overall_fits)
+    with col4:
+        create_scatterplot_per_income(df, 'happiness_score', 'carbon_footprint', 'Happiness Score', 'Carbon Footprint', overall_fits)
+
+    st.markdown("""Interestingly, <span style='background-color: LemonChiffon;'>happiness scores are positively correlated with both sustainable and unsustainable practices.</span>
+                Countries that <b>recycle more and have more forest land</b> (graph 1 & 2) tend to have higher happiness scores, showing the benefits of environmental care. 
+                At the same time, countries with <b>higher plastic waste and carbon footprints</b> (graph 3 & 4) also often report higher happiness, 
+                likely due to economic growth and consumption. This suggests that while sustainability contributes to well-being, 
+                economic development linked to unsustainable practices can also play a role in increasing happiness.""", unsafe_allow_html=True)
+
+    st.header("Results by income groups")
+    
+    st.markdown("""To gain a deeper insight, we will investigate correlations separately **for different income groups.**
+    """)
+    st.markdown("""<div style='text-align: center;'>Legend: <span style='color:#9b5de5;'>⬤</span> Low Income <span style='color:#f15bb5;'>⬤</span> Lower Middle Income   <span style='color:#fee440;'>⬤</span> Lower Upper Income   <span style='color:#00f5d4;'>⬤</span> High Income
+    </div>""", unsafe_allow_html=True)
+
+    metrics, arrays, fits = explorer_data(df, version)
+    for y_value, note in METRIC_NOTES.items():
+        st.subheader(metric_label(y_value))
+        display_income_group_row(arrays, fits, 'happiness_score', y_value, y_value, version)
+        st.markdown(note, unsafe_allow_html=True)
+
+    st.subheader("Compare any two measures")
+    st.markdown("Choose any two measures to compare them within each income group.")
+    display_metric_explorer(metrics, arrays, fits, version)
+    st.header("Correlation overview")
+    st.markdown("""All pairwise correlations between the measures above, for all countries or a single income group. 
+    Hover over a cell to see its p-value and the number of countries with data for both measures.""")
+    display_correlation_heatmap(correlations, version)
+
+    st.header("Conclusion")
+    st.markdown("""
+    
+    **Further analysis with comprehensive data and long-term studies is needed to understand the complex relationship between sustainability and happiness.**
+    While indicators like GDP, HDI, and SDGI correlate positively with happiness, environmental factors such as recycling rates and biocapacity reveal nuanced trends. 
+    Low and middle-income countries may achieve sustainability yet struggle with economic challenges, or lack resources for solutions tailored to wealthier nations. 
+    More research is required to determine if sustainability directly impacts happiness, considering these multifaceted variables.
+    
+    """)
+    st.markdown("""**As the next step in our research, we will analyze Finland,** the happiest and most sustainable country in the world according to the data, 
+    focusing on exploring the role of sustainable practices in shaping its high happiness levels. """)
+
+    st.header("Data Sources")
+    st.markdown("""
+                1. [World Happiness Report 2023](https://www.kaggle.com/datasets/sazidthe1/global-happiness-scores-and-factors?select=WHR_2023.csv)
+                2. [Global Ecological Footprint 2023](https://www.kaggle.com/datasets/jainaru/global-ecological-footprint-2023)
+                3. [Global Plastic Waste 2023](https://www.kaggle.com/datasets/prajwaldongre/global-plastic-waste-2023-a-country-wise-analysis)
+    
+    """)
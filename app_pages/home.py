@@ -0,0 +1,13 @@
+import streamlit as st
+
+
+def load_data():
+    """The home page has no data dependencies."""
+    return {}
+
+
+def render(data):
+    st.title("How do sustainable environmental practices of countries correlate with the well-being and happiness of their citizens?")
+    st.markdown("""Our project explores the link between a country’s 
+    sustainable practices and the happiness and mental wellbeing of its residents. As sustainability becomes a 
+    global priority, our goal is to explore specifics of these correlations.""")
@@ -0,0 +1,680 @@
+import time
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+from density import GRID, density_frame, likert_density
+from lazy_imports import lazy_import
+from rendered_figures import cached_png
+from result_cache import cached_result
+from session_state import page_state, set_page_value
+from survey_data import load_survey, survey_version
+from survey_statistics import cached_survey_statistics
+from survey_submissions import add_submission, answer_indexes
+
+alt = lazy_import('altair')
+plt = lazy_import('matplotlib.pyplot')
+sns = lazy_import('seaborn')
+stats = lazy_import('scipy.stats')
+Image = lazy_import('PIL.Image')
+
+# How long the result panel of "What about you?" stays visible after a submission
+RESULT_SECONDS = 15
+STATE_PAGE = 'leuphana_survey'
+
+
+def load_data():
+    """Datasets used by this page, parsed once per process (see survey_data.py)."""
+    return {
+        'survey': load_survey(),
+        'version': survey_version(),
+    }
+
+
+def correlation_scatterplot(x, y, x_label, y_label, correlation):
+    """Scatterplot of two survey answers with a regression line and their 2-D density."""
+    fig, ax = plt.subplots()
+
+    sns.scatterplot(x=x, y=y, ax=ax, color='#0b8b6a', alpha=0.5)
+    sns.regplot(x=x, y=y, ax=ax, scatter=False, color='red')
+    sns.kdeplot(x=x, y=y, ax=ax, cmap="Greens", fill=True, alpha=0.3)
+
+    ax.set_xlabel(x_label)
+    ax.set_ylabel(y_label)
+    ax.set_title(f"Correlation: {correlation:.2f}")
+    ax.grid(False)  # Remove grid
+    return fig
+
+
+def ecoanxiety_pie_chart(high_ecoanxiety_count, others_count):
+    fig, ax = plt.subplots()
+    labels = ["Ecoanxiety ≥ 5", "Others"]
+    sizes = [high_ecoanxiety_count, others_count]
+
+    # Custom colors (adjust as needed)
+    colors = ["#0b8b6a", "#5A5A63"]  # Dark grayish-blue for high ecoanxiety
+
+    ax.pie(sizes, labels=labels, autopct="%1.1f%%", startangle=90, colors=colors, textprops={"color": "white", "fontsize": 12, "weight": "bold"})
+    # Add a legend placed on the right
+    ax.legend(labels, title="Ecoanxiety Categories", loc="upper left", bbox_to_anchor=(1, 0.5), fontsize=10, frameon=False)
+    return fig
+
+
+def styled_radio(label, options, key):
+    return st.radio(label, options, index=options.index(5), horizontal=True)
+
+
+def ridgeline_plot(data, user_value, category_name, color):
+    """Generates a ridgeline plot from a precomputed density curve (value, Density) and a user position dot."""
+
+    column_name = data.columns[0]  # Get the first column name (the answer values)
+
+    base = (
+        alt.Chart(data)
+        .mark_area(opacity=0.5, color=color)
+        .encode(
+            x=alt.X(column_name, title=category_name, scale=alt.Scale(zero=False)),
+            y=alt.Y("Density:Q", axis=None),
+        )
+    )
+
+    # Added user position as a black dot
+    user_point = pd.DataFrame({column_name: [user_value]})
+
+    point = (
+        alt.Chart(user_point)
+        .mark_circle(size=100, color="black")
+        .encode(x=alt.X(column_name), y=alt.value(0))  # Keep y at zero
+    )
+
+    return base + point 
+
+
+@st.fragment
+def what_about_you(input_df, version):
+    """
+    The "What about you?" form and result panel.
+
+    As a fragment, moving a radio or submitting only reruns this function, not the
+    whole page. The panel is shown for RESULT_SECONDS after a submission; the only
+    per-session state is when it expires (see session_state.py).
+    """
+    ecoanxiety_input = styled_radio("Your Eco-Anxiety Level:", list(range(1, 8)), "ecoanxiety_status")
+    sustainable_practices_input = styled_radio("Your Sustainable Practices Score:", list(range(1, 8)), "sustainable_practices")
+    activities_nature_input = styled_radio("Your Activities in Nature:", list(range(1, 8)), "activities_nature")
+
+    # Submission is appended to the submissions log (the original file is never rewritten)
+    if st.button("Check out now!"):
+        add_submission(
+            {
+                "ecoanxiety_status": ecoanxiety_input,
+                "sustainable_practices": sustainable_practices_input,
+                "activities_nature": activities_nature_input,
+            }
+        )
+
+        st.success("Thank you for taking part! ✅")
+
+        set_page_value(STATE_PAGE, 'result_until', time.time() + RESULT_SECONDS)
+
+    # Hide the graph after some time
+    if time.time() > page_state(STATE_PAGE).get('result_until', 0):
+        return
+
+    st.subheader("Your Position in the Distribution!")
+
+    # Answer histograms of the survey responses plus everything submitted so far (see percentile_index.py)
+    indexes = answer_indexes(input_df, version)
+
+    # Density curves for Altair, computed from the 7 answer counts (cheap, so not cached)
+    eco_data = pd.DataFrame({"Eco-anxiety Levels": GRID, "Density": likert_density(indexes["ecoanxiety_status"].counts)})
+    sust_data = pd.DataFrame({"Frequency of Sustainable Activities": GRID, "Density": likert_density(indexes["sustainable_practices"].counts)})
+    nature_data = pd.DataFrame({"Frequency of Activities in Nature": GRID, "Density": likert_density(indexes["activities_nature"].counts)})
+
+    # Initializing variables
+    eco_below, eco_above = None, None
+    sust_below, sust_above = None, None
+    act_below, act_above = None, None
+
+    # Compute percentiles
+    eco_below, eco_above = indexes["ecoanxiety_status"].percentiles(ecoanxiety_input)
+    sust_below, sust_above = indexes["sustainable_practices"].percentiles(sustainable_practices_input)
+    act_below, act_above = indexes["activities_nature"].percentiles(activities_nature_input)
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown(f"### Eco-Anxiety Level🌱\n📊 {eco_below:.2f}% of people have a lower score, {eco_above:.2f}% have a higher score.")
+    
+        anxiety_chart=ridgeline_plot(eco_data, ecoanxiety_input, "Eco-Anxiety Level", "#9c3368")  # Red one 
+        st.altair_chart(anxiety_chart, use_container_width=True) 
+
+    with col2:
+        st.markdown(f"### Sustainable Practices♻️ \n📊 {sust_below:.2f}% of people have a lower score, {sust_above:.2f}% have a higher score.")
+    
+        sustainability_chart=ridgeline_plot(sust_data, sustainable_practices_input, "Sustainable Practices", "#0b8b6a")  # Green one
+        st.altair_chart(sustainability_chart, use_container_width=True) 
+
+    with col3:
+        st.markdown(f"###  Activities in Nature🌿\n📊 {act_below:.2f}% of people have a lower score, {act_above:.2f}% have a higher score.")
+    
+        nature_chart=ridgeline_plot(nature_data, activities_nature_input, "Activities in Nature", "gray")  # Gray one
+        st.altair_chart(nature_chart, use_container_width=True) 
+
+
+def display_resampling_statistics(statistics, group, x, y):
+    """Shows the bootstrap confidence interval and permutation p-value of a pair (see survey_statistics.py)."""
+    row = statistics.loc[(group, x, y)]
+    st.write(f"**95% bootstrap CI:** [{row['ci_low']:.2f}, {row['ci_high']:.2f}]")
+    st.write(f"**Permutation p-value:** {row['p_permutation']:.4f}")
+
+
+def render(data):
+
+    st.title("What about our context?")
+    st.write(
+    "To gain insights into how sustainable practices impact the well-being of students at Leuphana University, "
+    "we conducted a survey focused on environmental awareness and lifestyle choices. This study explores "
+    "students' perceptions, behaviors, and attitudes toward sustainability, alongside its potential effects "
+    "on their mental and physical well-being. The data provides insights into how sustainability integrates "
+    "into students' daily lives and contributes to their overall quality of life."
+)   
+    st.subheader("Statistics of Leuphana Students 2024/25 (N=303)")
+    st.markdown(
+        "<p style='font-size:18px; color:gray;'>This dashboard explores data gathered around campus and correctly weighted to compensate for not fully represented groups.</p>",
+        unsafe_allow_html=True
+    )
+
+    # Survey responses (gender labels are already translated, see survey_data.py)
+    main_df = data['survey']
+    main_df2 = data['survey']
+
+    # Bootstrap CIs and permutation p-values of all answer pairs, computed once per survey version
+    resampled = cached_survey_statistics(main_df, data['version'])
+
+    # Load images
+    image1 = Image.open("agedist.png")
+    image2 = Image.open("genderdist.png")
+
+    st.image(image1, caption="Age distribution across our survey", use_container_width=True)
+
+    st.subheader("Gender distribution across our survey")
+    st.image(image2, use_container_width=True)
+
+    # Section: General Leuphana Metrics
+    st.title("Which metrics did we take into account?")
+    st.subheader("Can a closer relationship to nature influence the frequency of sustainable practices?")
+    st.markdown(
+        "<p style='font-size:18px; color:gray;'>We analyzed various factors, including accessibility to nature, frequency of activities in nature, and engagement in sustainable practices.</p>",
+        unsafe_allow_html=True
+    )
+    st.write("We decided to investigate the median levels of accessibility to nature, frequency of activities played in natural environments, as well as frequency of sustainable practices. The results are shown below.")
+
+    # Dropdown menu for group selection
+    group = st.selectbox("Choose the group to visualize:", ["Female", "Male", "Overall"], index=0)
+
+    # Apply filtering
+    filtered_df = main_df if group == "Overall" else main_df[main_df['gender'] == group]
+
+    # Compute medians
+    practices_median = filtered_df['sustainable_practices'].median()
+    proximity_median = filtered_df['natural_acc'].median()
+    activities_median = filtered_df['activities_nature'].median()
+
+    # Set color dynamically
+    color_map = {"Female": "#9c3368", "Male": "#0e7669", "Overall": "#bbbbbb"}
+    box_color = color_map.get(group, "#bbbbbb")  # Default to gray
+
+    # Create layout for median values
+    col1_median, col2_median, col3_median = st.columns(3)
+
+    # CSS styling for boxes
+    box_style = f"""
+        background-color: {box_color};
+        padding: 20px;
+        border-radius: 15px;
+        text-align: center;
+        color: white;
+        width: 100%;
+        height: 180px;
+        display: flex;
+        flex-direction: column;
+        justify-content: center;
+    """
+
+    # Display the metric boxes
+    with col1_median:
+        st.markdown(f'<div style="{box_style}">'
+                    f'<h2>{proximity_median}/7.0</h2><h5>Accessibility of Natural Spaces</h5></div>', 
+                    unsafe_allow_html=True)
+
+    with col2_median:
+        st.markdown(f'<div style="{box_style}">'
+                    f'<h2>{activities_median}/7.0</h2><h5>Frequency of Activities in Nature</h5></div>', 
+                    unsafe_allow_html=True)
+
+    with col3_median:
+        st.markdown(f'<div style="{box_style}">'
+                    f'<h2>{practices_median}/7.0</h2><h5>Frequency of Sustainable Practices</h5></div>', 
+                    unsafe_allow_html=True)
+
+
+    #SCATTERPLOT SECTION | NATURE RELATIONSHIP VS SUSTAINABLE PRACTICES
+    #Include scatterplot of frequency of activities in the nature and sustainable practices. 
+    st.header("")
+    st.header("Is there a correlation between one's relationship to nature and the frequency of sustainable practices?")
+    st.markdown(
+        "<p style='font-size:18px; color:gray;'>Is it possible that a closer relationship with nature leads individuals to act more sustainably?</p>",
+        unsafe_allow_html=True
+    )
+
+    param1, param2 = main_df2['activities_nature'], main_df2['sustainable_practices']
+    valid_data = main_df2[[param1.name, param2.name]].replace([np.inf, -np.inf], np.nan).dropna()
+    param1, param2 = valid_data[param1.name], valid_data[param2.name]
+
+    # Calculate Pearson correlation
+    correlation, p_value = stats.pearsonr(param1, param2)
+
+    # Scatterplot with Regression Line, rendered once per survey version
+    fig_png = cached_png(
+        ('survey_scatterplot', data['version'], 'activities_nature', 'sustainable_practices', 'all'),
+        lambda: correlation_scatterplot(param1, param2, 'Frequency of Activities in Nature', 'Frequency of Sustainable Practices', correlation),
+    )
+
+    col1, col2 = st.columns(2)
+    with col1:
+
+        st.image(fig_png, use_container_width=True)
+
+    with col2:
+        # Display correlation info
+        st.write(f"**Pearson Correlation Coefficient:** {correlation:.2f}")
+        st.write(f"**P-value:** {p_value:.4f}")
+        display_resampling_statistics(resampled, 'all', 'activities_nature', 'sustainable_practices')
+        st.write("---")
+        st.markdown(
+            """
+            <div style="margin: 50px 50px; font-size: 23px;">
+            Among Leuphana students, there seems to be slight but not statistically significant correlation between being practicing sustainability and activities in nature.
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+
+    #SECOND SCATTERPLOT | ACCESSIBILITY VS SUSTAINABLE PRACTICES
+    # Second Scatterplot: Accessibility to Nature vs. Sustainable Practices
+    st.header("Can a closer geographical positioning to nature influence the frequency of sustainable practices?")
+    st.write("The hypothesis our team developed across the months was that one's proximity to nature would facilitate awareness or caring towards natural spaces and practices. We decided to inspect whether there is a practical correlation between the geographical proximity and the frequency of these practices.")
+
+    param3, param2 = main_df2['natural_acc'], main_df2['sustainable_practices']
+    valid_data = main_df2[[param3.name, param2.name]].replace([np.inf, -np.inf], np.nan).dropna()
+    param3, param2 = valid_data[param3.name], valid_data[param2.name]
+
+    # Calculate Pearson correlation
+    correlation, p_value = stats.pearsonr(param3, param2)
+
+    # Scatterplot with Regression Line, rendered once per survey version
+    fig_png = cached_png(
+        ('survey_scatterplot', data['version'], 'natural_acc', 'sustainable_practices', 'all'),
+        lambda: correlation_scatterplot(param3, param2, 'Accessibility to Natural Spaces', 'Frequency of Sustainable Practices', correlation),
+    )
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.image(fig_png, use_container_width=True)
+
+    with col2:
+        # Display correlation info
+        st.write(f"**Pearson Correlation Coefficient:** {correlation:.2f}")
+        st.write(f"**P-value:** {p_value:.4f}")
+        display_resampling_statistics(resampled, 'all', 'natural_acc', 'sustainable_practices')
+        st.write("---")
+        st.markdown(
+            """
+            <div style="margin: 50px 50px; font-size: 23px;">
+            Among Leuphana students, there seems to be no correlation between accessibility to natural spaces and frequency of sustainable practices.
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+
+    #OTHER SECTIONNNNN ABOUT ECO-ANXIETY
+    st.header("Eco-anxiety levels by gender")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+
+        # Density curves per gender plus an "Overall" curve, computed on the server (see density.py)
+        densities = cached_result(
+            ('ecoanxiety_by_gender',),
+            data['version'],
+            lambda: density_frame(main_df['ecoanxiety_status'], 'ecoanxiety_status', main_df['gender'], overall='Overall'),
+        ).rename(columns={'group': 'gender'})
+
+        # Define color scale for genders using custom hex colors
+        color_scale = alt.Scale(domain=['Female', 'Male', 'Overall'], range=['#9c3368', '#0e7669', 'gray'])
+
+        # Generate a base Altair chart for the ridgeline effect
+        base = alt.Chart(densities).mark_area(
+            opacity=0.6,
+            line={'color': 'black'}
+        ).encode(
+            x='ecoanxiety_status:Q',
+            y=alt.Y('density:Q', axis=None),
+            color=alt.Color('gender:N', scale=color_scale),
+            row='gender:N'
+        ).properties(
+            height=100,
+        )
+
+        with st.container():
+            st.altair_chart(base, use_container_width=True)
+
+    with col2:
+
+        st.markdown(
+            """
+            <div style="margin: 150px 150px; font-size: 23px;">
+            Among Leuphana students, women reported higher eco-anxiety levels on average.
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+
+    # Determine Median in general and per Gender
+    female_data = main_df[main_df['gender'] == 'Female']['ecoanxiety_status']
+    male_data = main_df[main_df['gender'] == 'Male']['ecoanxiety_status']
+
+    # Calculate the median
+    female_median = female_data.median()
+    male_median = male_data.median()
+    all_median = main_df['ecoanxiety_status'].median()
+
+
+    # Define the CSS for the styled boxes
+    box_style = """
+        <style>
+            .rounded-box {
+                margin: 10px;
+                padding: 20px;
+                border-radius: 15px;
+                text-align: center;
+                box-shadow: 2px 2px 10px rgba(0, 0, 0, 0.1);
+                font-size: 22px;
+                font-weight: bold;
+                color: #ffffff; /* White text */
+            }
+            .female-box {
+                background-color: #9c3368; /* Dark red */
+            }
+            .male-box {
+                background-color: #0e7669; /* Forest green */
+            }
+            .overall-box {
+                background-color: #6e6e6e; /* Light grey */
+            }
+            .subtext {
+                font-size: 16px;
+                color: #ffffff; /* White text */
+                font-weight: normal;
+            }
+        </style>
+    """
+
+    # Render the CSS in Streamlit
+    st.markdown(box_style, unsafe_allow_html=True)
+
+    # Display the rounded boxes in the three columns
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown(f"""
+            <div class='rounded-box female-box'>
+                {female_median}/7.0
+                <div class='subtext'>Female Median</div>
+            </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(f"""
+            <div class='rounded-box male-box'>
+                {male_median}/7.0
+                <div class='subtext'>Male Median</div>
+            </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown(f"""
+            <div class='rounded-box overall-box'>
+                {all_median}/7.0
+                <div class='subtext'>Leuphana Median</div>
+            </div>
+        """, unsafe_allow_html=True)
+
+
+
+    # Count individuals with ecoanxiety_status >= 5
+    high_ecoanxiety_count = (main_df["ecoanxiety_status"] >= 5).sum()
+    others_count = len(main_df) - high_ecoanxiety_count
+
+
+    #OFFICIAL PIE CHART 
+    st.header("Who expressed high levels of Eco-Anxiety?")
+    st.markdown(
+        "<p style='font-size:18px; color:gray;'>We decided to take a closer look at individuals who expressed higher levels of eco-anxiety that we defined as equal or above to 5</p>",
+        unsafe_allow_html=True
+    )
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Create Pie Chart, rendered once per survey version
+        fig_png = cached_png(
+            ('survey_pie', data['version'], 'ecoanxiety_status>=5'),
+            lambda: ecoanxiety_pie_chart(high_ecoanxiety_count, others_count),
+        )
+        # Display in Streamlit
+        st.image(fig_png, use_container_width=True)
+
+    with col2:
+
+        st.markdown(
+            """
+            <div style="margin: 150px 150px; font-size: 23px;">
+            Almost 30 percent of Leuphana students reported having high levels of eco-anxiety.
+            </div>
+            """,
+            unsafe_allow_html=True
+        )       
+
+    #Determine frequency of males with ecoanxiety beyond 5 
+    female_datas = main_df[main_df['gender'] == 'Female']
+    male_datas = main_df[main_df['gender'] == 'Male']
+    # Count males with eco-anxiety ≥ 5
+    high_ecoanxiety_males = (male_datas["ecoanxiety_status"] >= 5).sum()
+
+    # Count total males
+    total_males = len(male_datas)
+
+    # Calculate percentage
+    if total_males > 0:
+        percentage_males_high_ecoanxiety = round((high_ecoanxiety_males / total_males) * 100, 1)
+    else:
+        percentage_males_high_ecoanxiety = 0
+
+    #Count females with eco-anxiety > 5 (everything is weighted)
+
+    high_ecoanxiety_females = (female_datas["ecoanxiety_status"] >= 5).sum()
+
+    # Count total males
+    total_females = len(female_datas)
+
+    # Calculate percentage
+    if total_females > 0:
+        percentage_females_high_ecoanxiety = round((high_ecoanxiety_females / total_females) * 100, 1)
+    else:
+        percentage_females_high_ecoanxiety = 0
+
+    #Count age 
+    #Seek equilibrium of age and then check the most common age pattern 
+    low_age=main_df[main_df['age']=='18-24']
+    medium_age=main_df[main_df['age']=='25-34']
+    high_age=main_df[main_df['age']=='35-44']
+
+    high_ecoanxiety_lowage = (low_age["ecoanxiety_status"] >= 5).sum()
+    high_ecoanxiety_mediumage = (medium_age["ecoanxiety_status"] >= 5).sum()
+    high_ecoanxiety_highage = (high_age["ecoanxiety_status"] >= 5).sum()
+
+    # Count total males
+    total_lowage = len(low_age)
+    total_mediumage = len(medium_age)
+    total_highage = len(high_age)
+
+    # Calculate percentage of age
+
+    percentage_lowage=high_ecoanxiety_lowage/total_lowage*100 if total_lowage>0 else 0
+    percentage_highage=high_ecoanxiety_highage/total_highage*100 if total_highage>0 else 0
+    percentage_mediumage=high_ecoanxiety_mediumage/total_mediumage*100 if total_mediumage>0 else 0
+
+    largest_value_age = max(percentage_highage, percentage_mediumage, percentage_lowage)
+
+    if largest_value_age == percentage_highage:
+        largest_category = "35-44"
+    elif largest_value_age == percentage_mediumage:
+        largest_category = "25-34"
+    else:
+        largest_category = "18-24"
+
+
+    #Check distribution (scatterplot) specifically of those who are experiencing eco-anxiety 
+    #Questions: What improves the eco-anxiety levels? (less worse)
+
+    #Eco-anxiety of those who are closer to nature? (above or equal to 5) (median)
+    #Eco-anxiety of those who have more relationship to nature (above or equal to 5) (median)
+
+    st.header("Most common profile experiencing Eco-Anxiety?")
+
+    st.markdown(
+        "<p style='font-size:18px; color:gray;'>We decided to take a closer look at individuals who expressed higher levels of eco-anxiety that we defined as equal or above to 5</p>",
+        unsafe_allow_html=True
+    )
+
+    # Function to create a rounded box with color
+    def styled_box(value, label, color):
+        st.markdown(
+            f"""
+            <div style="
+                background-color: {color};
+                padding: 20px;
+                border-radius: 15px;
+                text-align: center;
+                color: white;
+                font-size: 24px;
+                font-weight: bold;">
+                {value}
+            </div>
+            <p style="text-align: center; font-size: 18px;">{label}</p>
+            """,
+            unsafe_allow_html=True
+        )
+
+    # Define columns
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        styled_box(percentage_females_high_ecoanxiety, "Frequency Females %", "#9c3368")  # Custom Red
+
+    with col2:
+        styled_box(percentage_males_high_ecoanxiety, "Frequency Males %", "#0b8b6a")  # Custom Green
+
+    with col3:
+        styled_box(largest_category, "Most frequent age group", "#7f8c8d")  # Gray
+
+
+    #SECTION ABOTU CORRELATION BETWEEN ECO-ANXIETY AND PROXIMITY TO NATURE
+    st.header("Anxiety, sustainability and acces to nature - correlated?")
+    st.write("Only people with anxiety above 5.")
+
+    col1, col2 = st.columns(2)
+
+    filtered_anxious = main_df[main_df["ecoanxiety_status"] >= 5]
+
+    param3, param4 = filtered_anxious['natural_acc'], filtered_anxious['ecoanxiety_status']
+    valid_data = filtered_anxious[[param3.name, param4.name]].replace([np.inf, -np.inf], np.nan).dropna()
+    param3, param4 = valid_data[param3.name], valid_data[param4.name]
+
+    # Calculate Pearson correlation
+    correlation, p_value = stats.pearsonr(param3, param4)
+
+    # Scatterplot with Regression Line, rendered once per survey version
+    fig_png = cached_png(
+        ('survey_scatterplot', data['version'], 'natural_acc', 'ecoanxiety_status', 'ecoanxiety_status>=5'),
+        lambda: correlation_scatterplot(param3, param4, 'Accessibility to Natural Spaces', 'EcoAnxiety Levels', correlation),
+    )
+
+    with col1:
+        st.subheader("Access to Natural Spaces and Eco-Anxiety")
+        st.image(fig_png, use_container_width=True)
+        st.write(f"**Pearson Correlation Coefficient:** {correlation:.2f}")
+        st.write(f"**P-value:** {p_value:.4f}")
+        display_resampling_statistics(resampled, 'ecoanxiety_status>=5', 'natural_acc', 'ecoanxiety_status')
+
+        st.markdown(
+            """
+            <div style="margin: 10px 10px; font-size: 23px;">
+            Among highly eco-anxious, access to natural spaces correlates negatively with anxiety levels.
+            </div>
+            """,
+            unsafe_allow_html=True
+        )      
+
+
+    with col2: 
+    #SECTION SUSTAINABLE PRACTICES AND ECO-ANXIETY
+        st.subheader("Frequency of Sustainable Practices and Eco-anxiety")
+
+        param5, param4 = filtered_anxious['sustainable_practices'], filtered_anxious['ecoanxiety_status']
+        valid_data = filtered_anxious[[param5.name, param4.name]].replace([np.inf, -np.inf], np.nan).dropna()
+        param5, param4 = valid_data[param5.name], valid_data[param4.name]
+
+        # Calculate Pearson correlation
+        correlation, p_value = stats.pearsonr(param5, param4)
+
+        # Scatterplot with Regression Line, rendered once per survey version
+        fig_png = cached_png(
+            ('survey_scatterplot', data['version'], 'sustainable_practices', 'ecoanxiety_status', 'ecoanxiety_status>=5'),
+            lambda: correlation_scatterplot(param5, param4, 'Sustainable Practices', 'EcoAnxiety Self-Reported Levels', correlation),
+        )
+
+        st.image(fig_png, use_container_width=True)
+
+        st.write(f"**Pearson Correlation Coefficient:** {correlation:.2f}")
+        st.write(f"**P-value:** {p_value:.4f}")
+        display_resampling_statistics(resampled, 'ecoanxiety_status>=5', 'sustainable_practices', 'ecoanxiety_status')
+
+        st.markdown(
+            """
+            <div style="margin: 10px 10px; font-size: 23px;">
+            Among highly eco-anxious, sustainable practices correlate slightly positively with anxiety levels.
+            </div>
+            """,
+            unsafe_allow_html=True
+        )      
+
+    # INTERACTIVE SECTION FEATURE 
+    st.title("What about you?")
+    st.markdown(
+        "<p style='font-size:18px; color:gray;'>Are you as sustainable as other Leuphana students? Do you spend enough time in nature? Check it out now!</p>",
+        unsafe_allow_html=True
+    )
+    st.markdown(
+        "<p style='font-size:12px; color:gray;'>All data is collected anonymously and has purely scientific purposes.</p>",
+        unsafe_allow_html=True
+    )
+
+    # Radios, submission and result panel rerun on their own (see what_about_you)
+    what_about_you(data['survey'], data['version'])
@@ -0,0 +1,16 @@
+import streamlit as st
+
+from lazy_imports import lazy_import
+
+Image = lazy_import('PIL.Image')
+
+
+def load_data():
+    """The references page has no data dependencies."""
+    return {}
+
+
+def render(data):
+    st.title("See our code and references od GitHub")
+    qr = Image.open("QR.png")
+    st.image(qr, width=500)
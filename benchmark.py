@@ -0,0 +1,205 @@
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from unittest import mock
+
+# Headless benchmark of every page of app.py, run with Streamlit's AppTest.
+#
+#   python benchmark.py                          # all pages, saves benchmark_baseline.json
+#   python benchmark.py --compare benchmark_baseline.json --output benchmark_latest.json
+#
+# Each page runs in its own Python process, so the first ("cold") run includes
+# imports and data loading, and the peak RSS belongs to that page alone. The
+# following ("warm") runs show the cost of a rerun with all caches filled.
+# Network access is replaced by a local stub, results never depend on a remote API.
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+BASELINE_PATH = 'benchmark_baseline.json'
+WARM_RUNS = 3
+RUN_TIMEOUT = 300  # seconds per AppTest run
+
+
+class _OfflineResponse:
+    def __init__(self, content=b'', json_data=None):
+        self.content = content
+        self.status_code = 200
+        self._json = json_data
+
+    def json(self):
+        return self._json
+
+    def raise_for_status(self):
+        pass
+
+
+def offline_get(url, *args, **kwargs):
+    """
+    Stand-in for requests.get: RestCountries flag lookups are answered from the
+    bundled flags, every other request fails as if the network was down.
+    """
+    import requests
+    from flag_store import RESTCOUNTRIES_URL, flag_path
+
+    prefix = RESTCOUNTRIES_URL.format(code='')
+    if url.startswith(prefix):
+        code = url[len(prefix):].upper()
+        return _OfflineResponse(json_data=[{'flags': {'png': 'file://' + flag_path(code)}}])
+    if url.startswith('file://'):
+        try:
+            with open(url[len('file://'):], 'rb') as f:
+                return _OfflineResponse(content=f.read())
+        except FileNotFoundError:
+            raise requests.HTTPError(f"No local file for {url}")
+    raise requests.ConnectionError(f"Network access is disabled during benchmarks: {url}")
+
+
+def _section_recorder(sections, clock):
+    """Wraps st.title/st.header so every call starts a new timed section."""
+    def wrap(function):
+        def timed(body, *args, **kwargs):
+            now = time.perf_counter()
+            sections[-1]['seconds'] = now - clock['section_start']
+            sections.append({'section': str(body) or '(untitled)', 'seconds': 0.0})
+            clock['section_start'] = now
+            return function(body, *args, **kwargs)
+        return timed
+    return wrap
+
+
+def _timed_run(app, st):
+    """Runs the app once, returns (seconds, sections, exceptions)."""
+    sections = [{'section': '(before first header)', 'seconds': 0.0}]
+    clock = {'section_start': time.perf_counter()}
+    wrap = _section_recorder(sections, clock)
+
+    with mock.patch.object(st, 'title', wrap(st.title)), mock.patch.object(st, 'header', wrap(st.header)):
+        start = time.perf_counter()
+        app.run()
+        end = time.perf_counter()
+    sections[-1]['seconds'] = end - clock['section_start']
+
+    for section in sections:
+        section['seconds'] = round(section['seconds'], 4)
+    return end - start, sections, [str(e.value) for e in app.exception]
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def benchmark_page(page, warm_runs=WARM_RUNS):
+    """Benchmarks one page in the current process (see run_isolated() for a fresh process)."""
+    import requests
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    with mock.patch('streamlit_option_menu.option_menu', return_value=page), \
+            mock.patch.object(requests, 'get', offline_get), \
+            mock.patch.dict(os.environ, {'FLAGS_BACKGROUND_REFRESH': ''}):
+        app = AppTest.from_file(APP_PATH, default_timeout=RUN_TIMEOUT)
+        cold_seconds, cold_sections, exceptions = _timed_run(app, st)
+
+        warm_seconds, warm_sections = [], []
+        for _ in range(warm_runs):
+            seconds, warm_sections, warm_exceptions = _timed_run(app, st)
+            warm_seconds.append(round(seconds, 4))
+            exceptions += warm_exceptions
+
+    from data_loader import cache_stats
+    from figure_cache import figure_cache_stats
+    from lazy_imports import import_report
+    from result_cache import result_cache_stats
+
+    return {
+        'cold_seconds': round(cold_seconds, 4),
+        'warm_seconds': warm_seconds,
+        'warm_median_seconds': round(statistics.median(warm_seconds), 4) if warm_seconds else None,
+        'peak_rss_mb': _peak_rss_mb(),
+        'exceptions': exceptions,
+        'sections': {'cold': cold_sections, 'warm': warm_sections},
+        'slowest_imports': import_report()[:5],
+        'data_cache': cache_stats(),
+        'result_cache': result_cache_stats(),
+        'figure_cache': figure_cache_stats(),
+    }
+
+
+def run_isolated(page, warm_runs=WARM_RUNS):
+    """Benchmarks one page in a new Python process and returns its results."""
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--worker', page, '--warm-runs', str(warm_runs)],
+        cwd=os.path.dirname(APP_PATH),
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        return {'error': completed.stderr.strip().splitlines()[-1:] or ['failed']}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def run_benchmarks(pages, warm_runs=WARM_RUNS):
+    import streamlit
+
+    results = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'streamlit': streamlit.__version__,
+        'platform': platform.platform(),
+        'warm_runs': warm_runs,
+        'pages': {},
+    }
+    for page in pages:
+        print(f"Benchmarking {page}...", file=sys.stderr)
+        results['pages'][page] = run_isolated(page, warm_runs)
+    return results
+
+
+def compare(results, baseline):
+    """Prints each page's timings and memory next to the baseline, with the relative change."""
+    def change(new, old):
+        if new is None or not old:
+            return ''
+        return f"({(new - old) / old * 100:+.0f}%)"
+
+    print(f"{'Page':<24}{'cold s':>18}{'warm s':>18}{'peak RSS MB':>22}")
+    for page, result in results['pages'].items():
+        old = baseline.get('pages', {}).get(page, {})
+        if 'error' in result:
+            print(f"{page:<24}  error: {result['error']}")
+            continue
+        cold = f"{result['cold_seconds']:.2f} {change(result['cold_seconds'], old.get('cold_seconds'))}"
+        warm = f"{result['warm_median_seconds']:.2f} {change(result['warm_median_seconds'], old.get('warm_median_seconds'))}"
+        rss = f"{result['peak_rss_mb']:.0f} {change(result['peak_rss_mb'], old.get('peak_rss_mb'))}"
+        print(f"{page:<24}{cold:>18}{warm:>18}{rss:>22}")
+
+
+if __name__ == '__main__':
+    from app_pages import PAGES
+
+    parser = argparse.ArgumentParser(description="Benchmark every page of app.py")
+    parser.add_argument('--pages', nargs='+', default=list(PAGES), help="pages to run (default: all)")
+    parser.add_argument('--warm-runs', type=int, default=WARM_RUNS)
+    parser.add_argument('--output', default=BASELINE_PATH, help="where to save the results")
+    parser.add_argument('--compare', help="baseline JSON to compare the results with")
+    parser.add_argument('--worker', help=argparse.SUPPRESS)  # internal: benchmark one page, print JSON
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(benchmark_page(args.worker, args.warm_runs)))
+        sys.exit(0)
+
+    benchmark_results = run_benchmarks(args.pages, args.warm_runs)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(benchmark_results, f, indent=2, ensure_ascii=False)
+    print(f"Saved results for {len(benchmark_results['pages'])} pages to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            compare(benchmark_results, json.load(f))
@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+
+from lazy_imports import lazy_import
+from result_cache import cached_result
+
+stats = lazy_import('scipy.stats')
+go = lazy_import('plotly.graph_objects')
+
+# All-pairs Pearson and Spearman correlations (with p-values) of the numeric columns
+# of a table, overall and per group, computed once per dataset version.
+ALL_GROUPS = 'all'
+METHODS = ['pearson', 'spearman']
+
+
+def _p_values(r, n):
+    """Two-sided p-values of correlation coefficients r from n observations (t-test, as in scipy)."""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        dof = n - 2
+        t = r * np.sqrt(dof / (1 - r ** 2))
+        p = 2 * stats.t.sf(np.abs(t), dof)
+    p = np.where(np.abs(r) >= 1, 0.0, p)
+    return np.where(dof > 0, p, np.nan)
+
+
+def _group_matrices(numeric):
+    """Correlation, p-value and pairwise observation count matrices of one group."""
+    present = numeric.notna().to_numpy(dtype='float64')
+    n = present.T @ present  # rows where both columns are present
+
+    matrices = {'n': n}
+    for method in METHODS:
+        r = numeric.corr(method=method).to_numpy()
+        matrices[f'{method}_r'] = r
+        matrices[f'{method}_p'] = _p_values(r, n)
+    return matrices
+
+
+def correlation_table(df, columns=None, group_column=None):
+    """
+    Computes every pairwise correlation between the numeric columns of df.
+
+    Parameters:
+    df (DataFrame): Source data.
+    columns (list): Columns to correlate, defaults to all numeric columns.
+    group_column (str): Column (e.g. 'income_group') to also compute the matrices per value of.
+
+    Returns a DataFrame indexed by (group, x, y), group 'all' covering every row,
+    with n, pearson_r, pearson_p, spearman_r and spearman_p. Both orders of each pair
+    are included so any pair can be looked up directly.
+    """
+    if columns is None:
+        columns = list(df.select_dtypes('number').columns)
+    numeric = df[columns].astype('float64')
+
+    groups = [(ALL_GROUPS, numeric)]
+    if group_column is not None:
+        groups += [(group, rows) for group, rows in numeric.groupby(df[group_column], observed=True)]
+
+    frames = []
+    for group, rows in groups:
+        matrices = _group_matrices(rows)
+        index = pd.MultiIndex.from_product([[group], columns, columns], names=['group', 'x', 'y'])
+        frames.append(pd.DataFrame({name: matrix.ravel() for name, matrix in matrices.items()}, index=index))
+
+    table = pd.concat(frames).sort_index()
+    table['n'] = table['n'].astype(int)
+    return table
+
+
+def cached_correlation_table(df, columns=None, group_column=None, version=None):
+    """correlation_table() computed once per process and dataset version."""
+    if version is None:
+        return correlation_table(df, columns, group_column)
+    key = ('correlations', tuple(columns or ()), group_column)
+    return cached_result(key, version, lambda: correlation_table(df, columns, group_column))
+
+
+def correlation(table, x, y, group=ALL_GROUPS):
+    """Looks up one pair of a correlation_table() result, returns a dict of its statistics."""
+    row = table.loc[(group, x, y)].to_dict()
+    row['n'] = int(row['n'])
+    return row
+
+
+def correlation_matrix(table, method='pearson', group=ALL_GROUPS, columns=None, statistic='r'):
+    """Returns the square matrix of one statistic ('r' or 'p') of a correlation_table() result."""
+    matrix = table.loc[group, f'{method}_{statistic}'].unstack('y')
+    if columns is not None:
+        matrix = matrix.loc[columns, columns]
+    return matrix
+
+
+def build_heatmap(table, method='pearson', group=ALL_GROUPS, columns=None, labels=None):
+    """Builds a plotly heatmap of the correlation coefficients, with p-values and n on hover."""
+    r = correlation_matrix(table, method, group, columns, 'r')
+    p = correlation_matrix(table, method, group, columns, 'p')
+    n = table.loc[group, 'n'].unstack('y').loc[r.index, r.columns]
+    names = [labels.get(column, column) if labels else column for column in r.columns]
+
+    fig = go.Figure(data=go.Heatmap(
+        z=r.to_numpy(),
+        x=names,
+        y=names,
+        customdata=np.dstack([p.to_numpy(), n.to_numpy()]),
+        zmin=-1,
+        zmax=1,
+        colorscale='RdBu',
+        text=np.round(r.to_numpy(), 2),
+        texttemplate='%{text}',
+        hovertemplate='%{y} / %{x}<br>r = %{z:.3f}<br>p = %{customdata[0]:.3g}<br>n = %{customdata[1]}<extra></extra>',
+        colorbar=dict(title='r'),
+    ))
+    fig.update_layout(
+        height=550,
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        yaxis=dict(autorange='reversed'),
+        margin={"r": 0, "t": 30, "l": 0, "b": 0},
+    )
+    return fig
@@ -0,0 +1,53 @@
+import pandas as pd
+
+from data_loader import load_csv
+
+# Precomputed country code table (iso2, iso3, name, plotly_name), generated from
+# pycountry and plotly_countries_and_codes.csv by running: python country_codes.py
+# The app only reads this small CSV, so pycountry is not needed at runtime.
+CODES_PATH = 'country_codes.csv'
+
+# Eurobarometer uses a few codes that are not ISO 3166-1 alpha-2
+EUROBAROMETER_ALIASES = {'EL': 'GR', 'UK': 'GB'}
+
+
+def load_country_codes():
+    """Returns the country code table, parsed once per process."""
+    return load_csv(CODES_PATH, keep_default_na=False, na_values=[''])
+
+
+def iso2_to_iso3(codes):
+    """Maps a Series of ISO-2 (or Eurobarometer) codes to ISO-3 codes, unknown codes become NaN."""
+    table = load_country_codes()
+    mapping = pd.Series(table['iso3'].values, index=table['iso2'])
+    return codes.replace(EUROBAROMETER_ALIASES).map(mapping)
+
+
+def iso3_to_name(codes, default=None):
+    """Maps a Series of ISO-3 codes to country names."""
+    table = load_country_codes()
+    mapping = pd.Series(table['name'].values, index=table['iso3'])
+    names = codes.map(mapping)
+    return names if default is None else names.fillna(default)
+
+
+def build_country_codes():
+    import pycountry
+
+    codes_df = pd.DataFrame(
+        [(c.alpha_2, c.alpha_3, c.name) for c in pycountry.countries],
+        columns=['iso2', 'iso3', 'name'],
+    )
+
+    # Add the country names used in plotly_countries_and_codes.csv
+    plotly_df = pd.read_csv('plotly_countries_and_codes.csv')
+    plotly_df = plotly_df.rename(columns={'COUNTRY': 'plotly_name', 'CODE': 'iso3'})[['iso3', 'plotly_name']]
+    plotly_df = plotly_df.drop_duplicates(subset='iso3')
+
+    return codes_df.merge(plotly_df, on='iso3', how='left').sort_values('iso3')
+
+
+if __name__ == '__main__':
+    country_codes_df = build_country_codes()
+    country_codes_df.to_csv(CODES_PATH, index=False)
+    print(f"Saved {len(country_codes_df)} countries to {CODES_PATH}")
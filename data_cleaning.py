@@ -1,5 +1,6 @@
 # Import pandas library for data analysis
 import pandas as pd
+from data_schema import apply_global_data_schema, write_parquet
 
 plastic_df = pd.read_csv('global_plastic_waste.csv')
 whr_df = pd.read_csv('WHR_2023.csv')
@@ -88,4 +89,7 @@ print(df.info())
 # Save as a new csv file
 df.to_csv('global_data_new.csv', index=False)
 
+# Save a typed Parquet copy that the app loads without any type inference
+write_parquet(apply_global_data_schema(df), 'global_data_new.parquet')
+
 print(df.columns)
\ No newline at end of file
@@ -0,0 +1,159 @@
+import hashlib
+import importlib.util
+import os
+import threading
+
+import pandas as pd
+
+# Process-wide cache shared by every Streamlit session.
+# Streamlit re-executes app.py on every interaction, but imported modules stay
+# in memory, so anything stored here is parsed only once per server process.
+_cache = {}
+_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0}
+
+
+def _files(path):
+    # A directory (e.g. a partitioned store) is tracked through all the files it contains
+    if os.path.isdir(path):
+        return sorted(os.path.join(path, name) for name in os.listdir(path))
+    return [path]
+
+
+def _file_signature(path):
+    # mtime + size is cheap to check on every rerun (a single os.stat call per file)
+    signature = []
+    for file in _files(path):
+        stat = os.stat(file)
+        signature.append((file, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _file_hash(path):
+    # Only used when the mtime changed, to tell a real edit from a plain "touch"
+    digest = hashlib.sha1()
+    for file in _files(path):
+        with open(file, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def cached_load(path, loader, *args, **kwargs):
+    """
+    Loads a file once per process and returns the cached object afterwards.
+
+    The entry is invalidated when the file's mtime or size changes and its
+    content hash differs from the one that was loaded.
+
+    Parameters:
+    path (str): File to load, or a directory whose files are all tracked.
+    loader (callable): Function called as loader(path, *args, **kwargs) on a miss.
+    """
+    key = (path, loader, repr(args), repr(sorted(kwargs.items())))
+    signature = _file_signature(path)
+
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            if entry['signature'] == signature:
+                _stats['hits'] += 1
+                return entry['value']
+            # File was touched - reuse the cached value if the content is the same
+            if entry['hash'] == _file_hash(path):
+                entry['signature'] = signature
+                _stats['hits'] += 1
+                return entry['value']
+
+    value = loader(path, *args, **kwargs)
+    file_hash = _file_hash(path)
+
+    with _lock:
+        _cache[key] = {'signature': signature, 'hash': file_hash, 'value': value}
+        _stats['misses'] += 1
+    return value
+
+
+def load_csv(path, **read_csv_kwargs):
+    """
+    Returns the DataFrame stored in a CSV file, parsing it only once per process.
+
+    Every caller gets a shallow copy, so adding or replacing columns in one
+    session never leaks into the shared cached frame.
+    """
+    return cached_load(path, pd.read_csv, **read_csv_kwargs).copy(deep=False)
+
+
+def _read_typed_table(path, schema, **read_kwargs):
+    # Excel workbooks (e.g. the survey export) are read like the CSV files, only slower
+    if os.path.splitext(path)[1] in ('.xlsx', '.xls'):
+        df = pd.read_excel(path, **read_kwargs)
+    else:
+        df = pd.read_csv(path, **read_kwargs)
+    return schema(df) if schema else df
+
+
+def parquet_available():
+    return importlib.util.find_spec('pyarrow') is not None
+
+
+def load_table(csv_path, schema=None, **read_csv_kwargs):
+    """
+    Returns a dataset produced by the ETL scripts, preferring its Parquet copy.
+
+    The Parquet file (same name, .parquet extension) already stores the final
+    dtypes, so no type inference happens. When it is missing, older than the CSV
+    or pyarrow is not installed, the CSV (or Excel workbook) is parsed and typed
+    with schema (one of the apply_*_schema functions) instead.
+    """
+    path = table_path(csv_path)
+    if path != csv_path:
+        return cached_load(path, pd.read_parquet).copy(deep=False)
+    return cached_load(csv_path, _read_typed_table, schema, **read_csv_kwargs).copy(deep=False)
+
+
+def table_path(csv_path):
+    """
+    Returns the file load_table() reads for csv_path: its Parquet copy when usable, else the CSV.
+
+    The Parquet copy is only used when it is at least as new as the CSV, so an
+    edited CSV is never shadowed by a stale copy; rerun the ETL script to rebuild it.
+    """
+    parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+    if not (parquet_available() and os.path.exists(parquet_path)):
+        return csv_path
+    if os.path.exists(csv_path) and os.path.getmtime(parquet_path) < os.path.getmtime(csv_path):
+        return csv_path
+    return parquet_path
+
+
+def file_version(path):
+    """
+    Returns the content hash of a file, used to key results derived from it
+    (e.g. cached figures). Reuses the hash computed when the file was loaded.
+    """
+    signature = _file_signature(path)
+    with _lock:
+        for key, entry in _cache.items():
+            if key[0] == path and entry['signature'] == signature:
+                return entry['hash']
+    return _file_hash(path)
+
+
+def table_version(csv_path):
+    """Content hash of the file load_table() reads for csv_path."""
+    return file_version(table_path(csv_path))
+
+
+def cache_stats():
+    """Returns hit/miss counters and the number of cached files."""
+    with _lock:
+        return {'hits': _stats['hits'], 'misses': _stats['misses'], 'entries': len(_cache)}
+
+
+def clear_cache():
+    """Drops every cached object and resets the counters."""
+    with _lock:
+        _cache.clear()
+        _stats['hits'] = 0
+        _stats['misses'] = 0
@@ -0,0 +1,79 @@
+import pandas as pd
+
+# Explicit column types for the files produced by the ETL scripts.
+# The same schema is applied when writing the Parquet files and when the app
+# has to fall back to the CSV files, so both sources give identical DataFrames.
+
+GLOBAL_DATA_INDEX = 'code'
+GLOBAL_DATA_STRINGS = ['country']
+GLOBAL_DATA_CATEGORIES = ['income_group', 'region_x', 'region_y', 'main_sources', 'coastal_waste_risk']
+
+RENEWABLES_STRINGS = ['entity']
+RENEWABLES_INTEGERS = ['year']
+
+
+def _to_float32(df, columns):
+    for column in columns:
+        df[column] = pd.to_numeric(df[column], errors='coerce').astype('float32')
+    return df
+
+
+def apply_global_data_schema(df):
+    """
+    Types the merged global dataset (global_data_new): float32 metrics,
+    categorical groupings and the ISO-3 country code as the index.
+    """
+    df = df.copy()
+    for column in GLOBAL_DATA_STRINGS:
+        df[column] = df[column].astype('string')
+    for column in GLOBAL_DATA_CATEGORIES:
+        df[column] = df[column].astype('category')
+
+    metrics = [c for c in df.columns
+               if c not in GLOBAL_DATA_STRINGS + GLOBAL_DATA_CATEGORIES + [GLOBAL_DATA_INDEX]]
+    _to_float32(df, metrics)
+
+    return df.set_index(GLOBAL_DATA_INDEX)
+
+
+def apply_renewables_schema(df):
+    """Types a renewables extract (e.g. EUrenewables2020): float32 metrics and integer years."""
+    df = df.copy()
+    for column in RENEWABLES_STRINGS:
+        df[column] = df[column].astype('string')
+    for column in RENEWABLES_INTEGERS:
+        df[column] = df[column].astype('int16')
+
+    metrics = [c for c in df.columns if c not in RENEWABLES_STRINGS + RENEWABLES_INTEGERS]
+    return _to_float32(df, metrics)
+
+
+def apply_timeseries_schema(df):
+    """Types the WHR time series: one float32 column per year, country names as the index."""
+    df = df.copy()
+    df.index = df.index.astype('string')
+    df.index.name = 'country'
+    # Parquet needs string column names, the years are kept as e.g. "2015"
+    df.columns = [str(c) for c in df.columns]
+    return _to_float32(df, df.columns)
+
+
+def apply_whr_factors_schema(df):
+    """Types the long WHR factors table: one row per (country, year) with float32 factors."""
+    df = df.copy()
+    df['country'] = df['country'].astype('string')
+    df['region'] = df['region'].astype('category')
+    df['year'] = df['year'].astype('int16')
+
+    factors = [c for c in df.columns if c not in ['country', 'region', 'year']]
+    return _to_float32(df, factors)
+
+
+def write_parquet(df, path):
+    """
+    Saves a typed DataFrame as Parquet, keeping its dtypes and its index.
+
+    A named index (e.g. country) is stored as a column; a default 0..n-1 index is
+    only recorded in the metadata, so it reads back as a RangeIndex like the CSV.
+    """
+    df.to_parquet(path, index=None)
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+
+from percentile_index import LIKERT_MAX, likert_counts
+
+# Gaussian kernel density curves of Likert answers, evaluated on a fixed grid.
+# They are computed from the answer counts per level, so a curve costs the same
+# for 300 or 300,000 answers and a chart only ships GRID_POINTS values.
+GRID_POINTS = 200
+GRID = np.linspace(1, LIKERT_MAX, GRID_POINTS)
+LEVELS = np.arange(1, LIKERT_MAX + 1)
+
+
+def _quantile(counts, q):
+    # Linear interpolation between the answers around position q * (n - 1), like np.quantile
+    cumulative = np.cumsum(counts)
+    position = q * (cumulative[-1] - 1)
+    lower = LEVELS[np.searchsorted(cumulative, np.floor(position), side='right')]
+    upper = LEVELS[np.searchsorted(cumulative, np.ceil(position), side='right')]
+    return lower + (upper - lower) * (position - np.floor(position))
+
+
+def bandwidth(counts):
+    """Kernel bandwidth by the rule of thumb Vega-Lite's transform_density uses."""
+    n = counts.sum()
+    mean = (LEVELS * counts).sum() / n
+    deviation = np.sqrt((counts * (LEVELS - mean) ** 2).sum() / max(n - 1, 1))
+    iqr = (_quantile(counts, 0.75) - _quantile(counts, 0.25)) / 1.34
+    spread = min(deviation, iqr) or deviation or 1.0
+    return 1.06 * spread * n ** -0.2
+
+
+def likert_density(counts, grid=GRID):
+    """Returns the density of answers with the given counts per level at every grid point."""
+    counts = np.asarray(counts, dtype='float64')
+    n = counts.sum()
+    if n == 0:
+        return np.zeros_like(grid)
+    h = bandwidth(counts)
+    z = (grid[:, None] - LEVELS[None, :]) / h
+    kernels = np.exp(-0.5 * z ** 2) / np.sqrt(2 * np.pi)
+    return kernels @ counts / (n * h)
+
+
+def density_frame(values, value_name, groups=None, overall=None):
+    """
+    Returns density curves as a long DataFrame (value_name, 'density' and optionally 'group').
+
+    Parameters:
+    values (Series): Answers on the 1-7 scale.
+    value_name (str): Name of the column holding the grid values.
+    groups (Series): Optional group of every answer (e.g. gender), one curve per group.
+    overall (str): When given with groups, an extra curve over all answers under this name.
+    """
+    if groups is None:
+        return pd.DataFrame({value_name: GRID, 'density': likert_density(likert_counts(values))})
+
+    curves = []
+    for group, group_values in values.groupby(groups, observed=True):
+        curves.append((group, likert_counts(group_values)))
+    if overall is not None:
+        curves.append((overall, likert_counts(values)))
+
+    return pd.concat([
+        pd.DataFrame({'group': group, value_name: GRID, 'density': likert_density(counts)})
+        for group, counts in curves
+    ], ignore_index=True)
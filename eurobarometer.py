@@ -0,0 +1,130 @@
+import hashlib
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+# Raw Flash Eurobarometer 256 (2009) tables, one workbook per country: fl256_TableC_<CC>.xls
+# Offline tool for exploring the raw tables, the app itself reads the curated Q8.xlsx.
+# Usage: python eurobarometer.py
+RAW_FOLDER = 'Eurobarometer_2009'
+CACHE_FOLDER = 'eurobarometer_cache'  # parsed workbooks, one Parquet file per file hash and parser version
+PARSER_VERSION = 1  # increase when parse_workbook() changes, so older cached results are not reused
+OUTPUT_PATH = 'eurobarometer_2009.parquet'
+
+COLUMNS = ['country', 'question_id', 'question', 'answer', 'statistic', 'segment_group', 'segment', 'value']
+QUESTION_ID = re.compile(r'^([A-Z]+\d+(?:_[A-Z]+)?)\.')
+
+
+def country_from_filename(file):
+    # "fl256_TableC_FI.xls" -> "FI" (Eurobarometer codes, e.g. EL for Greece and UK for the United Kingdom)
+    return os.path.splitext(file)[0].split('_')[-1]
+
+
+def file_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _segment_columns(group_row, segment_row):
+    # Column 2 holds the country total, the others a (group, segment) pair, e.g. ("Gender", "Male").
+    # Group labels are only written above the first column of each group, so they are carried forward.
+    columns = {2: ('Total', 'Total')}
+    group = None
+    for i in range(3, len(group_row)):
+        if pd.notna(group_row[i]):
+            group = str(group_row[i]).strip()
+        if pd.notna(segment_row[i]):
+            columns[i] = (group, str(segment_row[i]).strip())
+    return columns
+
+
+def parse_workbook(path):
+    """
+    Extracts every question table of a country workbook into a tidy long DataFrame
+    with one row per (question, answer, statistic, segment).
+    """
+    country = country_from_filename(os.path.basename(path))
+    sheet = pd.read_excel(path, sheet_name=0, header=None)
+    rows = sheet.values.tolist()
+
+    records = []
+    question = question_id = None
+    segments = {}
+    answer = None
+    for i, row in enumerate(rows):
+        label, statistic = row[0], row[1]
+
+        # A question title is a label on an otherwise empty row, followed by the two header rows
+        if isinstance(label, str) and all(pd.isna(v) for v in row[1:]) and i + 2 < len(rows):
+            question = label.strip()
+            match = QUESTION_ID.match(question)
+            question_id = match.group(1) if match else None
+            segments = _segment_columns(rows[i + 1], rows[i + 2])
+            answer = None
+            continue
+
+        # Answers are only labelled on their "N" row, the percentage rows below belong to the same answer
+        if isinstance(label, str):
+            answer = label.strip()
+        if question is None or answer is None or not isinstance(statistic, str) or statistic == 'Weighted total':
+            continue
+
+        for column, (segment_group, segment) in segments.items():
+            value = pd.to_numeric(row[column], errors='coerce')
+            records.append((country, question_id, question, answer, statistic.strip(), segment_group, segment, value))
+
+    return pd.DataFrame.from_records(records, columns=COLUMNS)
+
+
+def _parse_and_cache(path, cache_path):
+    df = parse_workbook(path)
+    df.to_parquet(cache_path, index=False)
+    return df
+
+
+def ingest(raw_folder=RAW_FOLDER, cache_folder=CACHE_FOLDER):
+    """
+    Parses all country workbooks into one long DataFrame.
+
+    Workbooks are parsed in parallel worker processes and each result is cached
+    under the hash of the workbook and PARSER_VERSION, so unchanged files are
+    never parsed again by the same parser.
+    """
+    os.makedirs(cache_folder, exist_ok=True)
+    paths = [os.path.join(raw_folder, f) for f in sorted(os.listdir(raw_folder)) if f.endswith('.xls')]
+
+    cached, to_parse = [], []
+    for path in paths:
+        cache_path = os.path.join(cache_folder, f"{file_hash(path)}_v{PARSER_VERSION}.parquet")
+        if os.path.exists(cache_path):
+            cached.append(pd.read_parquet(cache_path))
+        else:
+            to_parse.append((path, cache_path))
+
+    if to_parse:
+        with ProcessPoolExecutor() as executor:
+            parsed = list(executor.map(_parse_and_cache, *zip(*to_parse)))
+    else:
+        parsed = []
+
+    print(f"Parsed {len(to_parse)} workbooks, reused {len(cached)} from the cache")
+    return pd.concat(cached + parsed, ignore_index=True)
+
+
+def apply_eurobarometer_schema(df):
+    """Categorical labels and float32 values, the long table repeats the same labels many times."""
+    df = df.copy()
+    for column in COLUMNS[:-1]:
+        df[column] = df[column].astype('category')
+    df['value'] = df['value'].astype('float32')
+    return df
+
+
+if __name__ == '__main__':
+    eurobarometer_df = apply_eurobarometer_schema(ingest())
+    eurobarometer_df.to_parquet(OUTPUT_PATH, index=False)
+
+    print(eurobarometer_df.head())
+    print(f"Saved {len(eurobarometer_df)} rows for {eurobarometer_df['country'].nunique()} countries to {OUTPUT_PATH}")
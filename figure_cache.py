@@ -0,0 +1,50 @@
+import threading
+from collections import OrderedDict
+
+# Process-wide cache of chart objects built from static data, shared by every session.
+# Keys must contain everything the chart depends on, including the dataset version
+# (see data_loader.table_version), so a changed data file produces new charts.
+# Only charts (and their rendered images) belong here; data results that are
+# expensive to recompute go to result_cache, where no chart can evict them.
+MAX_ENTRIES = 128
+
+_figures = OrderedDict()
+_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0}
+
+
+def cached_figure(key, build):
+    """
+    Returns the chart stored under key, calling build() only on the first request.
+
+    Cached charts are shared between sessions and must not be modified by callers.
+    The least recently used entry is dropped once MAX_ENTRIES is reached.
+    """
+    with _lock:
+        if key in _figures:
+            _figures.move_to_end(key)
+            _stats['hits'] += 1
+            return _figures[key]
+
+    figure = build()
+
+    with _lock:
+        _figures[key] = figure
+        _figures.move_to_end(key)
+        while len(_figures) > MAX_ENTRIES:
+            _figures.popitem(last=False)
+        _stats['misses'] += 1
+    return figure
+
+
+def figure_cache_stats():
+    """Returns hit/miss counters and the number of cached charts."""
+    with _lock:
+        return {'hits': _stats['hits'], 'misses': _stats['misses'], 'entries': len(_figures)}
+
+
+def clear_figure_cache():
+    with _lock:
+        _figures.clear()
+        _stats['hits'] = 0
+        _stats['misses'] = 0
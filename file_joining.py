@@ -1,49 +1,77 @@
 import pandas as pd
 import os
+from data_schema import apply_timeseries_schema, apply_whr_factors_schema, write_parquet
 
 # Define the folder where the CSV files are stored
 folder_path = "timeseries"
 
-# List all CSV files in the directory
-csv_files = [f for f in os.listdir(folder_path) if f.endswith('.csv')]
-
-# Initialize a dictionary to store happiness scores for all countries
-all_countries_happiness_scores = {}
-
-# Loop through each file and process it
-for file in csv_files:
-    file_path = os.path.join(folder_path, file)
-    
-    # Extract year from the file name (assuming the year is part of the filename)
-    year = file.split('.')[0]  # Adjust based on your file naming convention
-    
-    # Ensure that only the numeric year is kept (e.g., if file name contains extra text like "whr_2020.csv")
-    year = ''.join(filter(str.isdigit, year))
-    
-    # Read the CSV file into a DataFrame
-    df = pd.read_csv(file_path)
-    
-    # Loop through each row to extract the happiness score for each country
-    for index, row in df.iterrows():
-        country = row['country']
-        happiness_score = row['happiness_score']
-        
-        # Add the happiness score for the country in the dictionary
-        if country not in all_countries_happiness_scores:
-            all_countries_happiness_scores[country] = {}
-        
-        # Add the score for the specific year
-        all_countries_happiness_scores[country][year] = happiness_score
-
-# Convert the dictionary of all countries' happiness scores into a DataFrame
-all_countries_df = pd.DataFrame.from_dict(all_countries_happiness_scores, orient='index')
-
-# Rename the index to 'country'
-all_countries_df.index.name = 'country'
-
-# Save the DataFrame to a CSV file
-all_countries_df.to_csv('whr_timeseries.csv')
-
-# Display the DataFrame (optional)
-print("All Countries Data:")
-print(all_countries_df)
\ No newline at end of file
+# WHR columns read from every yearly file (all releases share this header)
+factors = [
+    'happiness_score', 'gdp_per_capita', 'social_support', 'healthy_life_expectancy',
+    'freedom_to_make_life_choices', 'generosity', 'perceptions_of_corruption',
+]
+canonical_columns = ['country', 'region'] + factors
+
+# Country spellings that changed between releases, mapped to the names used in global_data_new.csv
+country_aliases = {
+    'Czechia': 'Czech Republic',
+    'Turkiye': 'Turkey',
+    'Eswatini': 'Swaziland',
+    'Somaliland Region': 'Somaliland region',
+    'State of Palestine': 'Palestinian Territories',
+    'Congo': 'Congo (Brazzaville)',
+}
+
+
+def year_from_filename(file):
+    # Keep only the digits of the file name, e.g. "WHR_2020.csv" -> "2020"
+    return ''.join(filter(str.isdigit, file.split('.')[0]))
+
+
+def read_year(file_path):
+    """
+    Reads one yearly WHR file: one row per country with the columns in
+    canonical_columns plus the year.
+    """
+    # Only parse the needed columns; utf-8-sig drops the byte order mark of WHR_2021.csv
+    df = pd.read_csv(file_path, usecols=canonical_columns, encoding='utf-8-sig')
+    df = df[canonical_columns]
+
+    df['country'] = df['country'].str.strip().replace(country_aliases)
+    df['year'] = int(year_from_filename(os.path.basename(file_path)))
+
+    # If a country is listed twice in a year, keep the last row
+    return df.drop_duplicates(subset='country', keep='last')
+
+
+def read_all_years(folder_path):
+    """Parses all yearly files and returns one long DataFrame (country, year, factors)."""
+    csv_files = sorted(f for f in os.listdir(folder_path) if f.endswith('.csv'))
+    yearly_dfs = [read_year(os.path.join(folder_path, file)) for file in csv_files]
+    return pd.concat(yearly_dfs, ignore_index=True)
+
+
+def to_wide(long_df, indicator):
+    """Pivots one indicator to a table with countries as rows and years as columns."""
+    wide_df = long_df.pivot(index='country', columns='year', values=indicator)
+    wide_df.columns = [str(year) for year in wide_df.columns]
+    return wide_df
+
+
+if __name__ == '__main__':
+    # All factors of all years in long format: one row per (country, year)
+    long_df = read_all_years(folder_path)
+    long_df.to_csv('whr_factors.csv', index=False)
+    write_parquet(apply_whr_factors_schema(long_df), 'whr_factors.parquet')
+
+    # Pivot the happiness scores: countries as rows, years as columns
+    all_countries_df = to_wide(long_df, 'happiness_score')
+
+    # Save the DataFrame to a CSV file
+    all_countries_df.to_csv('whr_timeseries.csv')
+    # Typed Parquet copy used by the app
+    write_parquet(apply_timeseries_schema(all_countries_df), 'whr_timeseries.parquet')
+
+    # Display the DataFrame (optional)
+    print("All Countries Data:")
+    print(all_countries_df)
@@ -0,0 +1,111 @@
+import base64
+import os
+import threading
+from functools import lru_cache
+
+import requests
+
+# Bundled flag images, one PNG per country named after its ISO-3 code (e.g. FIN.png).
+# The images ship with the app, so selecting a country never waits on the network.
+# Flags downloaded by refresh_flags() go to FLAGS_CACHE_DIR (not tracked by git)
+# and take precedence over the bundled ones.
+FLAGS_DIR = 'flags'
+FLAGS_CACHE_DIR = 'flags_cache'
+RESTCOUNTRIES_URL = "https://restcountries.com/v3.1/alpha/{code}"
+REQUEST_TIMEOUT = 5  # seconds
+
+_refresh_lock = threading.Lock()
+_refresh_thread = None
+
+
+def _file_name(iso3_code):
+    return f"{iso3_code.upper()}.png"
+
+
+def flag_path(iso3_code):
+    """Path of the bundled flag of a country."""
+    return os.path.join(FLAGS_DIR, _file_name(iso3_code))
+
+
+def cached_flag_path(iso3_code):
+    """Path of the downloaded flag of a country in FLAGS_CACHE_DIR."""
+    return os.path.join(FLAGS_CACHE_DIR, _file_name(iso3_code))
+
+
+@lru_cache(maxsize=256)
+def flag_data_uri(iso3_code):
+    """
+    Returns the flag of a country as a base64 data URI usable in an <img> tag,
+    or None when no flag is bundled or downloaded for it.
+    """
+    if not iso3_code:
+        return None
+    for path in (cached_flag_path(iso3_code), flag_path(iso3_code)):
+        try:
+            with open(path, 'rb') as f:
+                encoded = base64.b64encode(f.read()).decode('ascii')
+        except FileNotFoundError:
+            continue
+        return f"data:image/png;base64,{encoded}"
+    return None
+
+
+def warm_flags(iso3_codes):
+    """Loads the flags of the given countries into the in-memory cache."""
+    for code in iso3_codes:
+        flag_data_uri(code)
+
+
+def _download_flag(iso3_code):
+    response = requests.get(RESTCOUNTRIES_URL.format(code=iso3_code.lower()), timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    data = response.json()
+    if not (data and isinstance(data, list) and "flags" in data[0]):
+        return False
+
+    image = requests.get(data[0]["flags"]["png"], timeout=REQUEST_TIMEOUT)
+    image.raise_for_status()
+
+    # Write to a temporary file first so readers never see a half written image
+    os.makedirs(FLAGS_CACHE_DIR, exist_ok=True)
+    temp_path = cached_flag_path(iso3_code) + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(image.content)
+    os.replace(temp_path, cached_flag_path(iso3_code))
+    return True
+
+
+def refresh_flags(iso3_codes):
+    """Downloads the latest flags from the RestCountries API into FLAGS_CACHE_DIR."""
+    refreshed = []
+    for code in iso3_codes:
+        try:
+            if _download_flag(code):
+                refreshed.append(code)
+        except (requests.RequestException, ValueError):
+            # Keep the bundled flag if the upstream is slow or unavailable
+            continue
+
+    if refreshed:
+        flag_data_uri.cache_clear()
+        warm_flags(iso3_codes)
+    return refreshed
+
+
+def refresh_flags_async(iso3_codes):
+    """
+    Starts refresh_flags() in a background thread, at most once per process.
+    The bundled flags keep being served until the refresh has finished.
+    """
+    global _refresh_thread
+    with _refresh_lock:
+        if _refresh_thread is None:
+            _refresh_thread = threading.Thread(target=refresh_flags, args=(list(iso3_codes),), daemon=True)
+            _refresh_thread.start()
+    return _refresh_thread
+
+
+if __name__ == '__main__':
+    # Download the latest flags into FLAGS_CACHE_DIR: python flag_store.py AUT BEL BGR ...
+    import sys
+    print("Refreshed:", refresh_flags(sys.argv[1:]))
@@ -0,0 +1,43 @@
+import json
+
+from data_loader import cached_load
+
+# Vendored world countries GeoJSON (Natural Earth 1:110m, simplified with
+# geojson_simplify.py), so the maps work without network access
+GEOJSON_PATH = 'countries.geo.json'
+
+
+def _read_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_world_geojson():
+    """
+    Returns the shared world countries GeoJSON, parsed once per process.
+
+    The returned object is shared between sessions and must not be modified,
+    use geojson_with_values() to attach data to the features.
+    """
+    return cached_load(GEOJSON_PATH, _read_json)
+
+
+def geojson_with_values(values, field, missing="No Data"):
+    """
+    Returns a copy of the world GeoJSON with an extra property on every feature.
+
+    Only the feature and properties dicts are copied, the (large) geometries are
+    shared with the cached GeoJSON.
+
+    Parameters:
+    values (dict): Mapping of country name (feature.properties.name) to value.
+    field (str): Name of the property to add, e.g. "Percentage".
+    missing: Value used for countries that are not in values.
+    """
+    geojson = load_world_geojson()
+    features = []
+    for feature in geojson['features']:
+        properties = dict(feature['properties'])
+        properties[field] = values.get(properties['name'], missing)
+        features.append({**feature, 'properties': properties})
+    return {'type': geojson['type'], 'features': features}
@@ -0,0 +1,102 @@
+import json
+import sys
+
+# Builds the vendored countries.geo.json used by the Eco-anxiety maps.
+# Usage: python geojson_simplify.py <source world countries GeoJSON> [tolerance]
+#
+# Only the country name and ISO-3 code are kept as properties, coordinates are
+# simplified with the Douglas-Peucker algorithm and rounded, so the asset stays
+# small enough to be embedded in the folium maps on every render.
+
+OUTPUT_PATH = 'countries.geo.json'
+DEFAULT_TOLERANCE = 0.05  # in degrees
+PRECISION = 3  # decimal places kept for coordinates
+
+
+def _point_line_distance(point, start, end):
+    # Perpendicular distance of point from the line start-end
+    if start == end:
+        return ((point[0] - start[0]) ** 2 + (point[1] - start[1]) ** 2) ** 0.5
+    dx, dy = end[0] - start[0], end[1] - start[1]
+    area = abs(dy * point[0] - dx * point[1] + end[0] * start[1] - end[1] * start[0])
+    return area / (dx ** 2 + dy ** 2) ** 0.5
+
+
+def simplify_line(points, tolerance):
+    """Douglas-Peucker simplification of a list of [lon, lat] points."""
+    if len(points) < 3:
+        return points
+
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        max_distance, index = 0, None
+        for i in range(first + 1, last):
+            distance = _point_line_distance(points[i], points[first], points[last])
+            if distance > max_distance:
+                max_distance, index = distance, i
+        if index is not None and max_distance > tolerance:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+
+    return [p for p, k in zip(points, keep) if k]
+
+
+def simplify_ring(ring, tolerance):
+    simplified = simplify_line([list(p[:2]) for p in ring], tolerance)
+    # A closed ring needs at least 4 points, otherwise keep the original one
+    if len(simplified) < 4:
+        simplified = [list(p[:2]) for p in ring]
+    return [[round(lon, PRECISION), round(lat, PRECISION)] for lon, lat in simplified]
+
+
+def simplify_geometry(geometry, tolerance):
+    if geometry['type'] == 'Polygon':
+        coordinates = [simplify_ring(ring, tolerance) for ring in geometry['coordinates']]
+    elif geometry['type'] == 'MultiPolygon':
+        coordinates = [[simplify_ring(ring, tolerance) for ring in polygon]
+                       for polygon in geometry['coordinates']]
+    else:
+        raise ValueError(f"Unsupported geometry type: {geometry['type']}")
+    return {'type': geometry['type'], 'coordinates': coordinates}
+
+
+def _property(properties, *names):
+    # Sources differ in the case of their property names (name / NAME, iso_a3 / ISO_A3)
+    lowered = {key.lower(): value for key, value in properties.items()}
+    for name in names:
+        if lowered.get(name) not in (None, '', '-99'):
+            return lowered[name]
+    return None
+
+
+def simplify_geojson(geojson, tolerance=DEFAULT_TOLERANCE):
+    features = []
+    for feature in geojson['features']:
+        properties = feature.get('properties') or {}
+        iso_a3 = _property(properties, 'iso_a3', 'adm0_a3') or feature.get('id')
+        features.append({
+            'type': 'Feature',
+            'id': iso_a3,
+            'properties': {'name': _property(properties, 'name', 'admin'), 'iso_a3': iso_a3},
+            'geometry': simplify_geometry(feature['geometry'], tolerance),
+        })
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+if __name__ == '__main__':
+    source_path = sys.argv[1]
+    tolerance = float(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_TOLERANCE
+
+    with open(source_path, encoding='utf-8') as f:
+        source = json.load(f)
+
+    simplified = simplify_geojson(source, tolerance)
+
+    with open(OUTPUT_PATH, 'w', encoding='utf-8') as f:
+        json.dump(simplified, f, separators=(',', ':'), ensure_ascii=False)
+
+    print(f"Saved {len(simplified['features'])} countries to {OUTPUT_PATH}")
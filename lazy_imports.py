@@ -0,0 +1,77 @@
+import contextvars
+import importlib
+import sys
+import threading
+import time
+
+# Import cost of every module loaded through this file, in order of first use.
+# Each entry is (module name, seconds, who triggered it), the time includes the
+# module's own dependencies that were not loaded yet.
+_timings = []
+_lock = threading.Lock()
+
+# Every Streamlit session runs the script in its own thread, a ContextVar keeps
+# the context of one session from leaking into another
+_context = contextvars.ContextVar('import_context', default='startup')
+
+
+def set_context(context):
+    """Sets who is responsible for the following imports in this thread, e.g. the page being rendered."""
+    _context.set(context)
+
+
+def timed_import(name, context=None):
+    """Imports a module and records how long the import took, unless it was already loaded."""
+    if name in sys.modules:
+        return sys.modules[name]
+
+    context = context or _context.get()
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    elapsed = time.perf_counter() - start
+
+    with _lock:
+        if not any(entry[0] == name for entry in _timings):
+            _timings.append((name, elapsed, context))
+    return module
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is only imported on first attribute access.
+
+    Example: plt = LazyModule('matplotlib.pyplot') costs nothing until plt.subplots()
+    is called, so pages that never draw a matplotlib figure never import matplotlib.
+    """
+
+    def __init__(self, name, context=None):
+        self._name = name
+        self._context = context
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = timed_import(self._name, self._context)
+        return self._module
+
+    def __getattr__(self, attribute):
+        return getattr(self._load(), attribute)
+
+    def __repr__(self):
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f"<LazyModule {self._name} ({state})>"
+
+
+def lazy_import(name, context=None):
+    """Returns a LazyModule for name; context (e.g. the page name) is shown in the timing report."""
+    return LazyModule(name, context)
+
+
+def import_report():
+    """Returns the recorded imports as a list of dicts, slowest first."""
+    with _lock:
+        timings = list(_timings)
+    return [
+        {'module': name, 'seconds': round(seconds, 4), 'loaded_by': context}
+        for name, seconds, context in sorted(timings, key=lambda entry: entry[1], reverse=True)
+    ]
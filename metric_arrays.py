@@ -0,0 +1,54 @@
+import numpy as np
+
+from partitions import partition_positions
+from result_cache import cached_result
+
+# Column values of a table split by group into plain NumPy arrays, built once per
+# dataset version so charts of any column pair can be drawn without filtering the
+# DataFrame again.
+
+
+def build_metric_arrays(df, group_column, columns=None, label_column='country'):
+    """
+    Splits the numeric columns of df by the values of group_column.
+
+    Parameters:
+    df (DataFrame): Source data.
+    group_column (str): Column to split by, e.g. 'income_group'.
+    columns (list): Columns to extract, defaults to all numeric columns.
+    label_column (str): Column with the point labels (e.g. country names for hover text).
+
+    Returns {group: {'labels': array, column: float64 array, ...}}; rows without a
+    group are left out.
+    """
+    if columns is None:
+        columns = list(df.select_dtypes('number').columns)
+
+    values = df[columns].to_numpy(dtype='float64')
+    labels = df[label_column].to_numpy(dtype=object)
+
+    arrays = {}
+    for group, positions in partition_positions(df, group_column).items():
+        group_values = values[positions]
+        arrays[group] = {'labels': labels[positions]}
+        for i, column in enumerate(columns):
+            arrays[group][column] = np.ascontiguousarray(group_values[:, i])
+    return arrays
+
+
+def cached_metric_arrays(df, group_column, columns=None, label_column='country', version=None):
+    """build_metric_arrays() computed once per process and dataset version."""
+    if version is None:
+        return build_metric_arrays(df, group_column, columns, label_column)
+    key = ('metric_arrays', group_column, tuple(columns or ()), label_column)
+    return cached_result(key, version, lambda: build_metric_arrays(df, group_column, columns, label_column))
+
+
+def pair_values(arrays, group, x, y):
+    """Returns the labels, x and y values of a group where both x and y are present."""
+    group_arrays = arrays.get(group)
+    if group_arrays is None:
+        empty = np.array([])
+        return empty.astype(object), empty, empty
+    valid = ~(np.isnan(group_arrays[x]) | np.isnan(group_arrays[y]))
+    return group_arrays['labels'][valid], group_arrays[x][valid], group_arrays[y][valid]
@@ -0,0 +1,42 @@
+from result_cache import cached_result
+
+# Row partitions of a table by the values of its grouping columns, built once per
+# dataset version so pages can take e.g. the EU-27 countries without masking the
+# whole table on every rerun.
+PARTITION_COLUMNS = ['income_group', 'region_x', 'region_y']
+
+
+def partition_positions(df, column):
+    """Returns {value: array of row positions} for a column, rows with a missing value are left out."""
+    return df.groupby(column, observed=True, sort=False).indices
+
+
+def build_partitions(df, columns=None):
+    """
+    Splits df by each of the given columns (defaults to PARTITION_COLUMNS).
+
+    Returns {(column, value): DataFrame}; every row appears once per column.
+    """
+    partitions = {}
+    for column in columns or PARTITION_COLUMNS:
+        for value, positions in partition_positions(df, column).items():
+            partitions[(column, value)] = df.iloc[positions]
+    return partitions
+
+
+def cached_partitions(df, columns=None, version=None):
+    """build_partitions() computed once per process and dataset version."""
+    if version is None:
+        return build_partitions(df, columns)
+    key = ('partitions', tuple(columns or PARTITION_COLUMNS))
+    return cached_result(key, version, lambda: build_partitions(df, columns))
+
+
+def get_partition(partitions, column, value):
+    """
+    Returns the rows where column == value, raises KeyError if there are none.
+
+    The result shares its data with the cached partition (a shallow copy), so callers
+    can add columns to it without affecting other sessions.
+    """
+    return partitions[(column, value)].copy(deep=False)
@@ -0,0 +1,40 @@
+import numpy as np
+
+# Answers on a 1..LIKERT_MAX scale
+LIKERT_MAX = 7
+
+
+def likert_counts(values):
+    """Returns the number of answers per level 1..LIKERT_MAX (index 0 is level 1)."""
+    values = np.asarray(values, dtype='int64')
+    return np.bincount(values, minlength=LIKERT_MAX + 1)[1:LIKERT_MAX + 1]
+
+
+class PercentileIndex:
+    """
+    Histogram and cumulative counts of the answers to one Likert question.
+
+    Adding an answer and asking which share of answers lies below a value both
+    take constant time, however many answers have been recorded.
+    """
+
+    def __init__(self, values=()):
+        self.counts = likert_counts(values)
+        # below[v - 1] = number of answers lower than v
+        self.below = np.concatenate([[0], np.cumsum(self.counts)[:-1]])
+        self.total = int(self.counts.sum())
+
+    def add(self, value):
+        value = int(value)
+        if not 1 <= value <= LIKERT_MAX:
+            raise ValueError(f"Answers must be between 1 and {LIKERT_MAX}, got {value}")
+        self.counts[value - 1] += 1
+        self.below[value:] += 1
+        self.total += 1
+
+    def percentiles(self, value):
+        """Returns the percentage of answers lower than value and the remaining percentage."""
+        if self.total == 0:
+            return 0.0, 100.0
+        below = self.below[int(value) - 1] / self.total * 100
+        return below, 100 - below
@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+
+from lazy_imports import lazy_import
+from result_cache import cached_result
+
+stats = lazy_import('scipy.stats')
+
+# Closed-form simple linear regression (y = intercept + slope * x) for many
+# (x, y) column pairs and groups at once, replacing per-chart statsmodels fits.
+ALL_GROUPS = 'all'
+
+
+def fit_pairs(df, pairs, group_column=None):
+    """
+    Fits y on x by ordinary least squares for every (x, y) pair and every group.
+
+    All pairs and groups are computed together with a few matrix products over
+    the sufficient statistics (n, means, sums of squares and cross products).
+    Rows where x or y is missing are ignored, like px.scatter(trendline="ols").
+
+    Parameters:
+    df (DataFrame): Data containing the columns of all pairs.
+    pairs (list): (x column, y column) tuples.
+    group_column (str): Column to fit separately per value of, e.g. 'income_group'.
+                        When None a single fit over all rows is made (group 'all').
+
+    Returns a DataFrame indexed by (x, y, group) with n, slope, intercept, r2,
+    mean_x, sxx and residual_variance.
+    """
+    x = df[[p[0] for p in pairs]].to_numpy(dtype='float64')  # (rows, pairs)
+    y = df[[p[1] for p in pairs]].to_numpy(dtype='float64')
+    valid = ~(np.isnan(x) | np.isnan(y))
+    x = np.where(valid, x, 0.0)
+    y = np.where(valid, y, 0.0)
+
+    # One-hot group membership (rows, groups); rows without a group belong to none
+    if group_column is None:
+        groups = [ALL_GROUPS]
+        membership = np.ones((len(df), 1))
+    else:
+        categorical = pd.Categorical(df[group_column])
+        groups = list(categorical.categories)
+        membership = np.zeros((len(df), len(groups)))
+        has_group = categorical.codes >= 0
+        membership[np.flatnonzero(has_group), categorical.codes[has_group]] = 1.0
+
+    # Sufficient statistics per (group, pair). The sums of squares and cross
+    # products are taken over values centered on their group mean, which avoids
+    # the cancellation of sum_xx - n * mean_x ** 2 for large, tightly spread values.
+    w = valid.astype('float64')
+    n = membership.T @ w
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_x = (membership.T @ x) / n
+        mean_y = (membership.T @ y) / n
+    dx = np.where(valid, x - membership @ np.nan_to_num(mean_x), 0.0)
+    dy = np.where(valid, y - membership @ np.nan_to_num(mean_y), 0.0)
+    sxx = membership.T @ (dx * dx)
+    syy = membership.T @ (dy * dy)
+    sxy = membership.T @ (dx * dy)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        slope = sxy / sxx
+        intercept = mean_y - slope * mean_x
+        r2 = sxy ** 2 / (sxx * syy)
+        residual_variance = (syy - slope * sxy) / (n - 2)
+
+    index = pd.MultiIndex.from_tuples(
+        [(p[0], p[1], g) for g in groups for p in pairs], names=['x', 'y', 'group']
+    )
+    return pd.DataFrame({
+        'n': n.ravel().astype(int),
+        'slope': slope.ravel(),
+        'intercept': intercept.ravel(),
+        'r2': r2.ravel(),
+        'mean_x': mean_x.ravel(),
+        'sxx': sxx.ravel(),
+        'residual_variance': residual_variance.ravel(),
+    }, index=index).sort_index()
+
+
+def cached_fit_pairs(df, pairs, group_column=None, version=None):
+    """fit_pairs() computed once per process and dataset version."""
+    if version is None:
+        return fit_pairs(df, pairs, group_column)
+    key = ('ols', tuple(pairs), group_column)
+    return cached_result(key, version, lambda: fit_pairs(df, pairs, group_column))
+
+
+def trendline(fit, x_values, confidence=0.95):
+    """
+    Evaluates a fit (one row of fit_pairs()) at x_values.
+
+    Returns a DataFrame with x, y and the lower/upper bounds of the confidence
+    band of the regression line (NaN when confidence is None, which also avoids
+    importing scipy).
+    """
+    x_values = np.sort(np.asarray(x_values, dtype='float64'))
+    y_values = fit['intercept'] + fit['slope'] * x_values
+
+    if confidence is not None and fit['n'] > 2:
+        t = stats.t.ppf((1 + confidence) / 2, fit['n'] - 2)
+        half_width = t * np.sqrt(fit['residual_variance'] * (1 / fit['n'] + (x_values - fit['mean_x']) ** 2 / fit['sxx']))
+    else:
+        half_width = np.full_like(x_values, np.nan)
+
+    return pd.DataFrame({'x': x_values, 'y': y_values, 'lower': y_values - half_width, 'upper': y_values + half_width})
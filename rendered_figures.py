@@ -0,0 +1,37 @@
+import io
+import threading
+
+from figure_cache import cached_figure
+from lazy_imports import lazy_import
+
+plt = lazy_import('matplotlib.pyplot')
+
+# Matplotlib figures rendered once to PNG bytes and shared by every session.
+# Figures are closed right after rendering, so pyplot does not keep them alive
+# in a long-running server process.
+SAVEFIG_KWARGS = {'format': 'png', 'dpi': 200, 'bbox_inches': 'tight'}  # same as st.pyplot
+
+# pyplot keeps global state, render one figure at a time
+_render_lock = threading.Lock()
+
+
+def figure_png(build):
+    """Calls build() to create a matplotlib figure, returns it as PNG bytes and closes it."""
+    with _render_lock:
+        fig = build()
+        try:
+            buffer = io.BytesIO()
+            fig.savefig(buffer, **SAVEFIG_KWARGS)
+            return buffer.getvalue()
+        finally:
+            plt.close(fig)
+
+
+def cached_png(key, build):
+    """
+    Returns the PNG bytes of the figure build() creates, rendering it only once per key.
+
+    The key must contain everything the figure depends on: the data version, the
+    columns drawn and any filter applied to the rows.
+    """
+    return cached_figure(('png',) + tuple(key), lambda: figure_png(build))
@@ -1,36 +1,23 @@
-import pandas as pd
+from data_schema import apply_renewables_schema, write_parquet
+from renewables_store import EU27_COUNTRIES, STORE_COLUMNS, read_renewables, write_partitioned_store
 
-renewables_df = pd.read_csv('renewables.csv')
-
-def standardize_columns(df):
-    df.columns = (
-        df.columns
-        .str.strip()         # Remove leading/trailing whitespace
-        .str.lower()         # Convert to lowercase
-        .str.replace(' ', '_')  # Replace spaces with underscores
-        .str.replace('[^a-z0-9_]', '', regex=True)  # Remove special characters
-    )
-    return df
-
-standardize_columns(renewables_df)
+# List of EU-27 country names
+eu27_countries = EU27_COUNTRIES
 
-renewables_2020 = renewables_df[renewables_df['year'] == 2020]
+# Stream the panel once, keeping only 2020 (the year and country filters are applied chunk by chunk)
+renewables_2020 = read_renewables(years=[2020])
 renewables_2020.to_csv('renewables2020.csv', index=False)
 
-renewables_2020['entity'] = renewables_2020['entity'].replace('Czechia', 'Czech Republic')
-# List of EU-27 country names
-eu27_countries = [
-    "Austria", "Belgium", "Bulgaria", "Croatia", "Cyprus", "Czech Republic",
-    "Denmark", "Estonia", "Finland", "France", "Germany", "Greece", "Hungary",
-    "Ireland", "Italy", "Latvia", "Lithuania", "Luxembourg", "Malta", "Netherlands",
-    "Poland", "Portugal", "Romania", "Slovakia", "Slovenia", "Spain", "Sweden"
-]
-
 # Filter for rows where the country column is in the EU-27 list
 eu27_renewables_2020 = renewables_2020[renewables_2020['entity'].isin(eu27_countries)]
 
 # Display the filtered DataFrame
 print(eu27_renewables_2020)
 eu27_renewables_2020.to_csv('EUrenewables2020.csv', index=False)
+# Typed Parquet copy used by the app
+write_parquet(apply_renewables_schema(eu27_renewables_2020.reset_index(drop=True)), 'EUrenewables2020.parquet')
+
+print(eu27_renewables_2020.columns)
 
-print(eu27_renewables_2020.columns)
\ No newline at end of file
+# Per-year partitioned store of the charted columns, so any year can be served without rescanning the panel
+write_partitioned_store(read_renewables(columns=STORE_COLUMNS))
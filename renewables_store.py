@@ -0,0 +1,134 @@
+import os
+import re
+
+import pandas as pd
+
+from data_loader import cached_load
+from data_schema import apply_renewables_schema, write_parquet
+
+# Full multi-year panel (2000-2020, all countries) and its per-year partitioned copy
+RENEWABLES_PATH = 'renewables.csv'
+STORE_PATH = 'renewables_by_year'
+CHUNKSIZE = 1000  # rows parsed at a time
+
+# Columns kept in the partitioned store, i.e. the ones the app charts
+STORE_COLUMNS = [
+    'entity', 'year',
+    'electricity_from_fossil_fuels_twh',
+    'electricity_from_nuclear_twh',
+    'electricity_from_renewables_twh',
+    'lowcarbon_electricity__electricity',
+    'renewable_energy_share_in_the_total_final_energy_consumption_',
+    'primary_energy_consumption_per_capita_kwhperson',
+]
+
+# Country names harmonized with global_data_new.csv
+ENTITY_ALIASES = {'Czechia': 'Czech Republic'}
+
+# List of EU-27 country names
+EU27_COUNTRIES = [
+    "Austria", "Belgium", "Bulgaria", "Croatia", "Cyprus", "Czech Republic",
+    "Denmark", "Estonia", "Finland", "France", "Germany", "Greece", "Hungary",
+    "Ireland", "Italy", "Latvia", "Lithuania", "Luxembourg", "Malta", "Netherlands",
+    "Poland", "Portugal", "Romania", "Slovakia", "Slovenia", "Spain", "Sweden"
+]
+
+
+def standardize_name(name):
+    # Same rules as standardize_columns() in the ETL scripts, for a single column name
+    name = name.strip().lower().replace(' ', '_')
+    return re.sub('[^a-z0-9_]', '', name)
+
+
+def read_renewables(path=RENEWABLES_PATH, years=None, entities=None, columns=None, chunksize=CHUNKSIZE):
+    """
+    Streams the renewables panel in chunks and returns only the matching rows.
+
+    Parameters:
+    years (list): Keep only these years (all years when None).
+    entities (list): Keep only these countries (all countries when None).
+    columns (list): Standardized column names to parse (all columns when None).
+    chunksize (int): Number of rows parsed at a time, bounds the peak memory use.
+    """
+    needed = None if columns is None else set(columns) | {'entity', 'year'}
+
+    chunks = []
+    reader = pd.read_csv(
+        path,
+        # Project columns already while parsing, using their standardized names
+        usecols=(lambda raw: needed is None or standardize_name(raw) in needed),
+        chunksize=chunksize,
+        # Some columns use thousands separators (e.g. density "2,239"); parsing them
+        # as numbers keeps the dtype the same in every chunk
+        thousands=',',
+    )
+    for chunk in reader:
+        chunk.columns = [standardize_name(c) for c in chunk.columns]
+        chunk['entity'] = chunk['entity'].replace(ENTITY_ALIASES)
+
+        # Push the filters down to every chunk so unused rows are dropped early
+        if years is not None:
+            chunk = chunk[chunk['year'].isin(years)]
+        if entities is not None:
+            chunk = chunk[chunk['entity'].isin(entities)]
+        chunks.append(chunk)
+
+    return pd.concat(chunks, ignore_index=True)
+
+
+def partition_path(year, store_path=STORE_PATH):
+    return os.path.join(store_path, f"{year}.parquet")
+
+
+def write_partitioned_store(df, store_path=STORE_PATH):
+    """Saves one typed Parquet file per year, e.g. renewables_by_year/2020.parquet."""
+    os.makedirs(store_path, exist_ok=True)
+    typed_df = apply_renewables_schema(df)
+    for year, year_df in typed_df.groupby('year'):
+        write_parquet(year_df.reset_index(drop=True), partition_path(year, store_path))
+
+
+def load_year(year, entities=None, store_path=STORE_PATH):
+    """Reads a single year from the partitioned store, optionally only some countries."""
+    filters = [('entity', 'in', list(entities))] if entities is not None else None
+    return pd.read_parquet(partition_path(year, store_path), filters=filters)
+
+
+def _read_indexed_store(store_path):
+    files = sorted(f for f in os.listdir(store_path) if f.endswith('.parquet'))
+    panel = pd.concat([pd.read_parquet(os.path.join(store_path, f)) for f in files], ignore_index=True)
+    panel = panel.set_index(['entity', 'year']).sort_index()
+
+    # Pre-slice the panel once, so every lookup afterwards is a single dict access
+    return {
+        'panel': panel,
+        'by_year': {year: year_df.droplevel('year') for year, year_df in panel.groupby(level='year')},
+        'by_country': {entity: entity_df.droplevel('entity') for entity, entity_df in panel.groupby(level='entity')},
+    }
+
+
+def load_indexed_store(store_path=STORE_PATH):
+    """
+    Returns the partitioned store indexed by (country, year), loaded once per process.
+
+    The result is a dict with the full 'panel' (MultiIndex entity/year) and the
+    precomputed slices 'by_year' (year -> countries) and 'by_country' (country -> years).
+    """
+    return cached_load(store_path, _read_indexed_store)
+
+
+def available_years(store_path=STORE_PATH):
+    return sorted(load_indexed_store(store_path)['by_year'])
+
+
+def year_slice(year, entities=None, store_path=STORE_PATH):
+    """Returns all countries of one year (indexed by country), optionally only some of them."""
+    year_df = load_indexed_store(store_path)['by_year'][year]
+    if entities is not None:
+        year_df = year_df[year_df.index.isin(entities)]
+    return year_df
+
+
+def country_slice(entity, store_path=STORE_PATH):
+    """Returns all years of one country (indexed by year)."""
+    return load_indexed_store(store_path)['by_country'][entity]
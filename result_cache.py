@@ -0,0 +1,49 @@
+import threading
+
+# Process-wide cache of data results derived from a dataset (regression fits,
+# correlation tables, partitions, resampling statistics), shared by every session.
+# Figures live in figure_cache; keeping them apart means no number of charts can
+# push out a result that is expensive to recompute.
+#
+# Every key holds the result of one dataset version (see data_loader.table_version).
+# A result computed for another version replaces it, so the cache holds one entry
+# per key and does not grow with data updates.
+_results = {}
+_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0}
+
+
+def cached_result(key, version, build):
+    """
+    Returns the result stored under key for this dataset version, calling build()
+    only when there is none yet.
+
+    The key must not contain the version itself, only what else the result depends
+    on (e.g. the columns used). Cached results are shared between sessions and must
+    not be modified by callers.
+    """
+    with _lock:
+        entry = _results.get(key)
+        if entry is not None and entry[0] == version:
+            _stats['hits'] += 1
+            return entry[1]
+
+    result = build()
+
+    with _lock:
+        _results[key] = (version, result)
+        _stats['misses'] += 1
+    return result
+
+
+def result_cache_stats():
+    """Returns hit/miss counters and the number of cached results."""
+    with _lock:
+        return {'hits': _stats['hits'], 'misses': _stats['misses'], 'entries': len(_results)}
+
+
+def clear_result_cache():
+    with _lock:
+        _results.clear()
+        _stats['hits'] = 0
+        _stats['misses'] = 0
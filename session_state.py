@@ -0,0 +1,33 @@
+import pickle
+
+import streamlit as st
+
+# Values a page keeps per browser session, stored in one small dict per page
+# (st.session_state['_<page>_state']) instead of loose session_state keys.
+# Both the number of entries and the size of each value are capped, so a
+# session's state cannot grow with the data or with how long the tab stays open.
+MAX_ENTRIES = 16
+MAX_VALUE_BYTES = 4096
+
+
+def page_state(page):
+    """Returns the state dict of a page for the current session."""
+    return st.session_state.setdefault(f'_{page}_state', {})
+
+
+def set_page_value(page, key, value):
+    """
+    Stores a value in the state of a page.
+
+    Raises ValueError for values larger than MAX_VALUE_BYTES when pickled; once
+    MAX_ENTRIES keys are stored, the oldest one is dropped to make room.
+    """
+    size = len(pickle.dumps(value))
+    if size > MAX_VALUE_BYTES:
+        raise ValueError(f"Session value '{key}' is {size} bytes, the limit is {MAX_VALUE_BYTES}")
+
+    state = page_state(page)
+    state.pop(key, None)
+    while len(state) >= MAX_ENTRIES:
+        state.pop(next(iter(state)))
+    state[key] = value
@@ -0,0 +1,45 @@
+import pandas as pd
+
+from data_loader import load_table, table_version
+from data_schema import write_parquet
+
+# Leuphana survey export. The app reads its Parquet copy (Formulary_Nature.parquet),
+# regenerated after a new export by running: python survey_data.py
+SURVEY_PATH = 'Formulary_Nature.xlsx'
+
+# Answers on a 1-7 scale
+LIKERT_COLUMNS = ['ecoanxiety_status', 'financial_satisfaction', 'natural_acc', 'activities_nature', 'sustainable_practices']
+GENDER_LABELS = {'Weiblich/Female': 'Female', 'Männlich/Male': 'Male'}
+
+
+def apply_survey_schema(df):
+    """English gender labels, categorical age/gender and small integer answers."""
+    df = df.copy()
+    df['gender'] = df['gender'].map(GENDER_LABELS).fillna(df['gender']).astype('category')
+    df['age'] = df['age'].astype('category')
+    for column in LIKERT_COLUMNS:
+        df[column] = df[column].astype('int8')
+    return df
+
+
+def load_survey():
+    """
+    Returns the survey responses, parsed once per process.
+
+    Each call returns a shallow copy of the cached frame: the data is shared, and
+    with pandas copy-on-write any change a page makes stays local to its copy.
+    """
+    return load_table(SURVEY_PATH, apply_survey_schema, sheet_name=0)
+
+
+def survey_version():
+    """Content hash of the survey file, used to key results derived from it."""
+    return table_version(SURVEY_PATH)
+
+
+if __name__ == '__main__':
+    survey_df = apply_survey_schema(pd.read_excel(SURVEY_PATH, sheet_name=0))
+    output_path = SURVEY_PATH.replace('.xlsx', '.parquet')
+    write_parquet(survey_df, output_path)
+
+    print(f"Saved {len(survey_df)} responses to {output_path}")
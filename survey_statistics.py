@@ -0,0 +1,111 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+from result_cache import cached_result
+from survey_data import LIKERT_COLUMNS
+
+# Bootstrap confidence intervals and permutation p-values of the Pearson correlation
+# for every pair of survey answers, overall and in the subgroups the page reports on.
+N_BOOTSTRAP = 2000
+N_PERMUTATIONS = 2000
+CONFIDENCE = 0.95
+SEED = 2025
+CHUNK_SIZE = 250  # resamples processed at once, bounds memory to CHUNK_SIZE * rows * columns
+
+SUBGROUPS = {
+    'all': lambda df: np.ones(len(df), dtype=bool),
+    'Female': lambda df: (df['gender'] == 'Female').to_numpy(),
+    'Male': lambda df: (df['gender'] == 'Male').to_numpy(),
+    'ecoanxiety_status>=5': lambda df: (df['ecoanxiety_status'] >= 5).to_numpy(),
+}
+
+
+def _standardize(values):
+    # Columns with zero mean and unit length, so Z.T @ Z is the correlation matrix
+    centered = values - values.mean(axis=-2, keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return centered / np.sqrt((centered ** 2).sum(axis=-2, keepdims=True))
+
+
+def _correlations(samples):
+    """Correlation matrices of a batch of samples with shape (batch, rows, columns)."""
+    z = _standardize(samples)
+    return np.matmul(z.transpose(0, 2, 1), z)
+
+
+def resample_statistics(values, n_bootstrap=N_BOOTSTRAP, n_permutations=N_PERMUTATIONS, seed=SEED):
+    """
+    Bootstraps and permutes the rows of values (rows x columns) for all column pairs at once.
+
+    Returns (r, ci_low, ci_high, p_permutation), each a columns x columns matrix.
+    A permutation shuffles the row order of one copy of the data, so every pair is
+    tested against the same shuffles and the whole matrix comes from one product.
+    """
+    rng = np.random.default_rng(seed)
+    n, k = values.shape
+    r = _correlations(values[None])[0]
+
+    bootstrap = []
+    exceed = np.zeros((k, k))
+    z = _standardize(values)
+    for start in range(0, max(n_bootstrap, n_permutations), CHUNK_SIZE):
+        size = min(CHUNK_SIZE, n_bootstrap - start)
+        if size > 0:
+            rows = rng.integers(0, n, size=(size, n))
+            bootstrap.append(_correlations(values[rows]))
+
+        size = min(CHUNK_SIZE, n_permutations - start)
+        if size > 0:
+            orders = rng.permuted(np.tile(np.arange(n), (size, 1)), axis=1)
+            permuted = np.matmul(z.T[None], z[orders])
+            exceed += (np.abs(permuted) >= np.abs(r) - 1e-12).sum(axis=0)
+
+    bootstrap = np.concatenate(bootstrap)
+    alpha = (1 - CONFIDENCE) / 2
+    ci_low, ci_high = np.nanquantile(bootstrap, [alpha, 1 - alpha], axis=0)
+    p_permutation = (exceed + 1) / (n_permutations + 1)
+    return r, ci_low, ci_high, p_permutation
+
+
+def _subgroup_table(group, values, columns, seed):
+    r, ci_low, ci_high, p_permutation = resample_statistics(values, seed=seed)
+    rows = []
+    for i, j in combinations(range(len(columns)), 2):
+        rows.append((group, columns[i], columns[j], len(values), r[i, j], ci_low[i, j], ci_high[i, j], p_permutation[i, j]))
+    return rows
+
+
+def survey_correlation_statistics(df, columns=None, subgroups=None, max_workers=4):
+    """
+    Computes the bootstrap CI and permutation p-value of every answer pair in every subgroup.
+
+    Subgroups are processed in parallel on a thread pool (the heavy work is NumPy
+    matrix products, which release the GIL). Results are reproducible: each
+    subgroup uses its own fixed seed.
+
+    Returns a DataFrame indexed by (group, x, y), holding both orders of each pair,
+    with n, r, ci_low, ci_high and p_permutation.
+    """
+    columns = columns or LIKERT_COLUMNS
+    subgroups = subgroups or SUBGROUPS
+    values = df[columns].to_numpy(dtype='float64')
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(_subgroup_table, group, values[select(df)], columns, SEED + i)
+            for i, (group, select) in enumerate(subgroups.items())
+        ]
+        rows = [row for future in futures for row in future.result()]
+
+    table = pd.DataFrame(rows, columns=['group', 'x', 'y', 'n', 'r', 'ci_low', 'ci_high', 'p_permutation'])
+    swapped = table.rename(columns={'x': 'y', 'y': 'x'})
+    return pd.concat([table, swapped]).set_index(['group', 'x', 'y']).sort_index()
+
+
+def cached_survey_statistics(df, version):
+    """survey_correlation_statistics() computed once per process and survey version."""
+    key = ('survey_statistics', N_BOOTSTRAP, N_PERMUTATIONS, SEED)
+    return cached_result(key, version, lambda: survey_correlation_statistics(df))
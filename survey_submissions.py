@@ -0,0 +1,154 @@
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from percentile_index import LIKERT_MAX, PercentileIndex
+
+# Answers submitted through "What about you?" on the Leuphana Survey page.
+# They are appended to a JSON Lines log (one submission per line), written in
+# batches, and never rewrite the original survey export.
+SUBMISSIONS_PATH = 'survey_submissions.jsonl'
+SUBMISSION_COLUMNS = ['ecoanxiety_status', 'sustainable_practices', 'activities_nature']
+
+# Pending submissions are written once there are BATCH_SIZE of them or the oldest
+# one has waited FLUSH_INTERVAL seconds (a timer started with the first pending one),
+# and at exit.
+BATCH_SIZE = 20
+FLUSH_INTERVAL = 5.0
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_state = {'loaded': False, 'submissions': [], 'pending': [], 'flush_timer': None}
+
+# Percentile indexes over the survey responses plus all submissions, per SUBMISSION_COLUMNS
+# entry, for the survey version they were built from
+_indexes = {'version': None, 'by_column': None}
+
+
+def _validated_answers(answers):
+    """Returns the SUBMISSION_COLUMNS answers as ints, raises ValueError unless each is 1..LIKERT_MAX."""
+    entry = {}
+    for column in SUBMISSION_COLUMNS:
+        value = int(answers[column])
+        if not 1 <= value <= LIKERT_MAX:
+            raise ValueError(f"{column} must be between 1 and {LIKERT_MAX}, got {value}")
+        entry[column] = value
+    return entry
+
+
+def _read_log(path):
+    # Lines that are not a valid submission (e.g. cut off by a crash while writing,
+    # or with an answer outside the scale) are skipped, so one bad line cannot break the page
+    submissions = []
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            for number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                    entry.update(_validated_answers(entry))
+                except (json.JSONDecodeError, AttributeError, KeyError, TypeError, ValueError):
+                    logger.warning("Skipping invalid submission on line %d of %s", number, path)
+                    continue
+                submissions.append(entry)
+    return submissions
+
+
+def _ensure_loaded():
+    # Called with _lock held: the log is read once per process
+    if not _state['loaded']:
+        _state['submissions'] = _read_log(SUBMISSIONS_PATH)
+        _state['loaded'] = True
+
+
+def _ends_without_newline(path):
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return False
+    with open(path, 'rb') as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) != b'\n'
+
+
+def _write_pending():
+    # Called with _lock held
+    if not _state['pending']:
+        return
+    lines = ''.join(json.dumps(entry, ensure_ascii=False) + '\n' for entry in _state['pending'])
+    if _ends_without_newline(SUBMISSIONS_PATH):
+        # Start on a new line after a line that was cut off, so only that one is lost
+        lines = '\n' + lines
+    with open(SUBMISSIONS_PATH, 'a', encoding='utf-8') as f:
+        f.write(lines)
+    _state['pending'] = []
+    if _state['flush_timer'] is not None:
+        _state['flush_timer'].cancel()
+        _state['flush_timer'] = None
+
+
+def _start_flush_timer():
+    # Called with _lock held, when the first submission of a batch is queued
+    timer = threading.Timer(FLUSH_INTERVAL, flush_submissions)
+    timer.daemon = True
+    timer.start()
+    _state['flush_timer'] = timer
+
+
+def add_submission(answers):
+    """
+    Records one submission: a dict with a 1-7 answer for every SUBMISSION_COLUMNS entry.
+
+    The submission counts in answer_indexes() immediately, it reaches the log
+    with the next batch, at the latest FLUSH_INTERVAL seconds later.
+    """
+    entry = _validated_answers(answers)
+    entry['submitted_at'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+
+    with _lock:
+        _ensure_loaded()
+        _state['submissions'].append(entry)
+        _state['pending'].append(entry)
+        if _indexes['by_column'] is not None:
+            for column in SUBMISSION_COLUMNS:
+                _indexes['by_column'][column].add(entry[column])
+
+        if len(_state['pending']) >= BATCH_SIZE:
+            _write_pending()
+        elif _state['flush_timer'] is None:
+            _start_flush_timer()
+
+
+def flush_submissions():
+    """Writes all pending submissions to the log."""
+    with _lock:
+        _write_pending()
+
+
+def answer_indexes(survey_df, version):
+    """
+    Returns {column: PercentileIndex} over the survey responses and every submission.
+
+    The indexes are built once per survey version and then kept up to date by
+    add_submission(), so percentile queries never scan the answers.
+    """
+    with _lock:
+        _ensure_loaded()
+        if _indexes['version'] != version or _indexes['by_column'] is None:
+            submissions = pd.DataFrame(_state['submissions'], columns=SUBMISSION_COLUMNS)
+            _indexes['by_column'] = {
+                column: PercentileIndex(np.concatenate([survey_df[column].to_numpy(), submissions[column].to_numpy(dtype='int64')]))
+                for column in SUBMISSION_COLUMNS
+            }
+            _indexes['version'] = version
+        return _indexes['by_column']
+
+
+atexit.register(flush_submissions)
@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from correlations import ALL_GROUPS, correlation, correlation_table
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(1)
+    a = rng.normal(size=80)
+    frame = pd.DataFrame({
+        'a': a,
+        'b': a + rng.normal(size=80),
+        'c': rng.normal(size=80),
+        'group': rng.choice(['HI', 'LI'], 80),
+    })
+    frame.loc[[2, 9], 'b'] = np.nan
+    return frame
+
+
+def test_matches_scipy(df):
+    table = correlation_table(df, ['a', 'b', 'c'], 'group')
+    for group, rows in [(ALL_GROUPS, df), *df.groupby('group')]:
+        rows = rows[['a', 'b']].dropna()
+        pair = correlation(table, 'a', 'b', group)
+        pearson = stats.pearsonr(rows['a'], rows['b'])
+        spearman = stats.spearmanr(rows['a'], rows['b'])
+        assert pair['n'] == len(rows)
+        assert pair['pearson_r'] == pytest.approx(pearson.statistic)
+        assert pair['pearson_p'] == pytest.approx(pearson.pvalue)
+        assert pair['spearman_r'] == pytest.approx(spearman.statistic)
+        assert pair['spearman_p'] == pytest.approx(spearman.pvalue)
+
+
+def test_both_orders_are_included(df):
+    table = correlation_table(df, ['a', 'b', 'c'])
+    assert correlation(table, 'a', 'c') == correlation(table, 'c', 'a')
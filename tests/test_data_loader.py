@@ -0,0 +1,76 @@
+import os
+
+import pandas as pd
+import pytest
+
+import data_loader
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    data_loader.clear_cache()
+    yield
+    data_loader.clear_cache()
+
+
+def set_mtime(path, seconds):
+    os.utime(path, (seconds, seconds))
+
+
+@pytest.fixture
+def table(tmp_path):
+    csv_path = tmp_path / 'table.csv'
+    pd.DataFrame({'a': [1, 2], 'b': [3.0, 4.0]}).to_csv(csv_path, index=False)
+    return str(csv_path)
+
+
+def test_table_path_without_parquet(table):
+    assert data_loader.table_path(table) == table
+
+
+@pytest.mark.skipif(not data_loader.parquet_available(), reason="needs pyarrow")
+def test_table_path_prefers_a_fresh_parquet_copy(table):
+    parquet_path = table.replace('.csv', '.parquet')
+    pd.read_csv(table).to_parquet(parquet_path)
+
+    set_mtime(table, 1_000_000)
+    set_mtime(parquet_path, 1_000_000)
+    assert data_loader.table_path(table) == parquet_path
+
+    # The CSV was edited after the copy was written: the copy is stale
+    set_mtime(table, 2_000_000)
+    assert data_loader.table_path(table) == table
+
+
+def test_table_path_without_pyarrow(table, monkeypatch):
+    pd.DataFrame({'a': [1]}).to_csv(table.replace('.csv', '.parquet'))
+    monkeypatch.setattr(data_loader, 'parquet_available', lambda: False)
+    assert data_loader.table_path(table) == table
+
+
+def test_cached_load_is_invalidated_by_content_changes_only(table):
+    calls = []
+
+    def loader(path):
+        calls.append(path)
+        return pd.read_csv(path)
+
+    first = data_loader.cached_load(table, loader)
+    assert data_loader.cached_load(table, loader) is first
+
+    # A touch changes the signature but not the content hash
+    set_mtime(table, 1_000_000)
+    assert data_loader.cached_load(table, loader) is first
+    assert len(calls) == 1
+
+    pd.DataFrame({'a': [5], 'b': [6.0]}).to_csv(table, index=False)
+    set_mtime(table, 2_000_000)
+    assert data_loader.cached_load(table, loader)['a'].tolist() == [5]
+    assert len(calls) == 2
+    assert data_loader.cache_stats() == {'hits': 2, 'misses': 2, 'entries': 1}
+
+
+def test_load_csv_returns_independent_copies(table):
+    df = data_loader.load_csv(table)
+    df['added'] = 1
+    assert 'added' not in data_loader.load_csv(table).columns
@@ -0,0 +1,27 @@
+import pandas as pd
+import pytest
+
+from data_loader import parquet_available
+from data_schema import write_parquet
+
+pytestmark = pytest.mark.skipif(not parquet_available(), reason="needs pyarrow")
+
+
+def test_filtered_frame_reads_back_like_the_csv(tmp_path):
+    df = pd.DataFrame({'entity': ['A', 'B', 'C'], 'value': [1.0, 2.0, 3.0]})
+    filtered = df[df['entity'] != 'B'].reset_index(drop=True)
+
+    write_parquet(filtered, tmp_path / 'filtered.parquet')
+    filtered.to_csv(tmp_path / 'filtered.csv', index=False)
+
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(tmp_path / 'filtered.parquet'),
+        pd.read_csv(tmp_path / 'filtered.csv'),
+        check_index_type=True,
+    )
+
+
+def test_named_index_is_kept(tmp_path):
+    df = pd.DataFrame({'value': [1.0, 2.0]}, index=pd.Index(['FIN', 'SWE'], name='country'))
+    write_parquet(df, tmp_path / 'indexed.parquet')
+    pd.testing.assert_frame_equal(pd.read_parquet(tmp_path / 'indexed.parquet'), df)
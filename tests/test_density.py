@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from density import GRID, bandwidth, density_frame, likert_density
+from percentile_index import likert_counts
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_likert_density_matches_gaussian_kde(seed):
+    values = np.random.default_rng(seed).integers(1, 8, size=250)
+    counts = likert_counts(values)
+    h = bandwidth(counts)
+
+    # gaussian_kde scales its bandwidth factor by the sample standard deviation
+    kde = stats.gaussian_kde(values, bw_method=h / values.std(ddof=1))
+    np.testing.assert_allclose(likert_density(counts), kde(GRID), rtol=1e-9, atol=1e-12)
+
+
+def test_bandwidth_uses_the_smaller_spread():
+    values = np.array([1, 2, 2, 3, 3, 3, 4, 4, 7, 7])
+    q75, q25 = np.quantile(values, [0.75, 0.25])
+    expected = 1.06 * min(values.std(ddof=1), (q75 - q25) / 1.34) * len(values) ** -0.2
+    assert bandwidth(likert_counts(values)) == pytest.approx(expected)
+
+
+def test_no_answers_give_a_flat_curve():
+    assert not likert_density(np.zeros(7)).any()
+
+
+def test_density_frame_per_group():
+    values = pd.Series([1, 2, 2, 5, 6, 7])
+    groups = pd.Series(['a', 'a', 'a', 'b', 'b', 'b'])
+    frame = density_frame(values, 'level', groups, overall='Overall')
+
+    assert set(frame['group']) == {'a', 'b', 'Overall'}
+    overall = frame.loc[frame['group'] == 'Overall', 'density'].to_numpy()
+    np.testing.assert_allclose(overall, likert_density(likert_counts(values)))
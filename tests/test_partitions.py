@@ -0,0 +1,33 @@
+import pandas as pd
+import pytest
+
+from partitions import build_partitions, get_partition
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        'country': ['A', 'B', 'C', 'D', 'E'],
+        'income_group': ['HI', 'LI', 'HI', None, 'LI'],
+        'value': [1.0, 2.0, 3.0, 4.0, 5.0],
+    })
+
+
+def test_partitions_match_boolean_masks(df):
+    partitions = build_partitions(df, ['income_group'])
+    for value in ['HI', 'LI']:
+        pd.testing.assert_frame_equal(get_partition(partitions, 'income_group', value), df[df['income_group'] == value])
+    # Rows with a missing value belong to no partition
+    assert sum(len(p) for p in partitions.values()) == 4
+
+
+def test_unknown_value_raises(df):
+    with pytest.raises(KeyError):
+        get_partition(build_partitions(df, ['income_group']), 'income_group', 'UM')
+
+
+def test_partition_copies_do_not_leak(df):
+    partitions = build_partitions(df, ['income_group'])
+    partition = get_partition(partitions, 'income_group', 'HI')
+    partition['added'] = 1
+    assert 'added' not in get_partition(partitions, 'income_group', 'HI').columns
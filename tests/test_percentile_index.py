@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from percentile_index import PercentileIndex, likert_counts
+
+
+def test_likert_counts():
+    assert likert_counts([1, 1, 3, 7]).tolist() == [2, 0, 1, 0, 0, 0, 1]
+
+
+def test_percentiles_match_a_scan_of_the_answers():
+    rng = np.random.default_rng(0)
+    values = rng.integers(1, 8, size=500)
+    index = PercentileIndex(values[:300])
+    for value in values[300:]:
+        index.add(value)
+
+    assert index.total == 500
+    for value in range(1, 8):
+        below, above = index.percentiles(value)
+        assert below == pytest.approx((values < value).mean() * 100)
+        assert below + above == pytest.approx(100)
+
+
+def test_empty_index():
+    assert PercentileIndex().percentiles(4) == (0.0, 100.0)
+
+
+@pytest.mark.parametrize('value', [0, 8])
+def test_add_rejects_values_outside_the_scale(value):
+    index = PercentileIndex([1, 2])
+    with pytest.raises(ValueError):
+        index.add(value)
+    assert index.total == 2
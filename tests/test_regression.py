@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from regression import ALL_GROUPS, fit_pairs, trendline
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    x = rng.normal(50, 10, 120)
+    frame = pd.DataFrame({
+        'x': x,
+        'y': 3 * x + rng.normal(0, 5, 120),
+        'z': rng.normal(0, 1, 120),
+        'group': rng.choice(['a', 'b', 'c'], 120),
+    })
+    frame.loc[[3, 40, 77], 'y'] = np.nan
+    frame.loc[5, 'group'] = None
+    return frame
+
+
+def test_matches_polyfit_overall(df):
+    fits = fit_pairs(df, [('x', 'y'), ('z', 'y')])
+    for x, y in [('x', 'y'), ('z', 'y')]:
+        rows = df[[x, y]].dropna()
+        slope, intercept = np.polyfit(rows[x], rows[y], 1)
+        fit = fits.loc[(x, y, ALL_GROUPS)]
+        assert fit['n'] == len(rows)
+        assert fit['slope'] == pytest.approx(slope)
+        assert fit['intercept'] == pytest.approx(intercept)
+        assert fit['r2'] == pytest.approx(np.corrcoef(rows[x], rows[y])[0, 1] ** 2)
+
+
+def test_matches_polyfit_per_group(df):
+    fits = fit_pairs(df, [('x', 'y')], 'group')
+    for group, rows in df.dropna(subset=['x', 'y', 'group']).groupby('group'):
+        slope, intercept = np.polyfit(rows['x'], rows['y'], 1)
+        assert fits.loc[('x', 'y', group), 'slope'] == pytest.approx(slope)
+        assert fits.loc[('x', 'y', group), 'intercept'] == pytest.approx(intercept)
+
+
+def test_large_offsets_keep_their_precision():
+    x = 1e8 + np.arange(20.0)
+    df = pd.DataFrame({'x': x, 'y': 2 * x + np.sin(np.arange(20.0))})
+    slope, intercept = np.polyfit(df['x'], df['y'], 1)
+    assert fit_pairs(df, [('x', 'y')]).iloc[0]['slope'] == pytest.approx(slope, rel=1e-9)
+
+
+def test_trendline_band_contains_the_line(df):
+    fit = fit_pairs(df, [('x', 'y')]).iloc[0]
+    line = trendline(fit, [30, 50, 70])
+    assert (line['lower'] < line['y']).all() and (line['y'] < line['upper']).all()
+    # The band is narrowest near the mean of x
+    widths = (line['upper'] - line['lower']).to_numpy()
+    assert widths[1] < widths[0] and widths[1] < widths[2]
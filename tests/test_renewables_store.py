@@ -0,0 +1,61 @@
+import pandas as pd
+import pytest
+
+import renewables_store
+
+RAW = """Entity,Year,Electricity from fossil fuels (TWh),Electricity from renewables (TWh),Density\\n(P/Km2)
+Czechia,2019,40.1,10.2,136
+Czechia,2020,39.7,10.4,136
+Finland,2019,9.9,35.1,18
+Finland,2020,9.8,35.9,18
+Germany,2019,250.0,240.0,240
+Germany,2020,231.0,251.0,"2,240"
+"""
+
+
+@pytest.fixture
+def panel_path(tmp_path):
+    path = tmp_path / 'renewables.csv'
+    path.write_text(RAW, encoding='utf-8')
+    return str(path)
+
+
+def test_read_renewables_filters_and_renames(panel_path):
+    df = renewables_store.read_renewables(panel_path, years=[2020], entities=['Czech Republic', 'Germany'], chunksize=2)
+
+    assert df['entity'].tolist() == ['Czech Republic', 'Germany']
+    assert 'electricity_from_renewables_twh' in df.columns
+    # Thousands separators are parsed in every chunk
+    assert df['densitynpkm2'].tolist() == [136, 2240]
+
+
+def test_read_renewables_projects_columns(panel_path):
+    df = renewables_store.read_renewables(panel_path, columns=['electricity_from_renewables_twh'])
+    assert list(df.columns) == ['entity', 'year', 'electricity_from_renewables_twh']
+    assert len(df) == 6
+
+
+@pytest.fixture
+def store_path(panel_path, tmp_path):
+    path = str(tmp_path / 'store')
+    columns = ['electricity_from_fossil_fuels_twh', 'electricity_from_renewables_twh']
+    renewables_store.write_partitioned_store(renewables_store.read_renewables(panel_path, columns=columns), path)
+    return path
+
+
+def test_partitioned_store_slices(store_path):
+    assert renewables_store.available_years(store_path) == [2019, 2020]
+
+    year = renewables_store.year_slice(2020, ['Finland', 'Germany'], store_path)
+    assert year.index.tolist() == ['Finland', 'Germany']
+    assert year.loc['Finland', 'electricity_from_renewables_twh'] == pytest.approx(35.9)
+
+    country = renewables_store.country_slice('Finland', store_path)
+    assert country.index.tolist() == [2019, 2020]
+    assert country.loc[2019, 'electricity_from_fossil_fuels_twh'] == pytest.approx(9.9)
+
+
+def test_load_year_reads_one_partition(store_path):
+    df = renewables_store.load_year(2019, ['Germany'], store_path)
+    assert df['entity'].tolist() == ['Germany']
+    assert (df['year'] == 2019).all()
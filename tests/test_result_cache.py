@@ -0,0 +1,26 @@
+import pytest
+
+import result_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    result_cache.clear_result_cache()
+    yield
+    result_cache.clear_result_cache()
+
+
+def test_result_is_built_once_per_version():
+    calls = []
+
+    def build():
+        calls.append(1)
+        return len(calls)
+
+    assert result_cache.cached_result(('fits',), 'v1', build) == 1
+    assert result_cache.cached_result(('fits',), 'v1', build) == 1
+    assert result_cache.cached_result(('fits',), 'v2', build) == 2
+
+    # The newer version replaced the older one
+    assert result_cache.cached_result(('fits',), 'v1', build) == 3
+    assert result_cache.result_cache_stats() == {'hits': 1, 'misses': 3, 'entries': 1}
@@ -0,0 +1,96 @@
+import json
+import time
+
+import pandas as pd
+import pytest
+
+import survey_submissions
+
+ANSWERS = {'ecoanxiety_status': 4, 'sustainable_practices': 5, 'activities_nature': 6}
+SURVEY = pd.DataFrame({column: pd.Series([], dtype='int8') for column in ANSWERS})
+
+
+@pytest.fixture
+def log_path(tmp_path, monkeypatch):
+    path = tmp_path / 'submissions.jsonl'
+    monkeypatch.setattr(survey_submissions, 'SUBMISSIONS_PATH', str(path))
+    monkeypatch.setattr(survey_submissions, '_state', {'loaded': False, 'submissions': [], 'pending': [], 'flush_timer': None})
+    monkeypatch.setattr(survey_submissions, '_indexes', {'version': None, 'by_column': None})
+    yield path
+    survey_submissions.flush_submissions()
+
+
+def logged_lines(path):
+    return path.read_text(encoding='utf-8').splitlines() if path.exists() else []
+
+
+def test_read_log_skips_invalid_lines(log_path):
+    log_path.write_text(
+        json.dumps(ANSWERS) + '\n'
+        + '{"ecoanxiety_status": 3, "sustai\n'  # cut off while writing
+        + '\n'
+        + '[1, 2, 3]\n'
+        + json.dumps({'ecoanxiety_status': 2}) + '\n'
+        + json.dumps(dict(ANSWERS, activities_nature=1)) + '\n',
+        encoding='utf-8',
+    )
+    submissions = survey_submissions._read_log(str(log_path))
+    assert [s['activities_nature'] for s in submissions] == [6, 1]
+
+
+def test_read_log_skips_invalid_answers(log_path):
+    log_path.write_text(
+        json.dumps(dict(ANSWERS, ecoanxiety_status='high')) + '\n'
+        + json.dumps(dict(ANSWERS, ecoanxiety_status=9)) + '\n'
+        + json.dumps(dict(ANSWERS, ecoanxiety_status=None)) + '\n'
+        + json.dumps(dict(ANSWERS, ecoanxiety_status='2')) + '\n',
+        encoding='utf-8',
+    )
+    submissions = survey_submissions._read_log(str(log_path))
+    assert [s['ecoanxiety_status'] for s in submissions] == [2]
+
+    # The page's percentile indexes load from the same log
+    indexes = survey_submissions.answer_indexes(SURVEY, 'v1')
+    assert indexes['ecoanxiety_status'].counts.tolist() == [0, 1, 0, 0, 0, 0, 0]
+
+
+def test_submissions_are_visible_before_they_are_written(log_path, monkeypatch):
+    monkeypatch.setattr(survey_submissions, 'FLUSH_INTERVAL', 60)
+    survey_submissions.add_submission(ANSWERS)
+
+    assert logged_lines(log_path) == []
+    assert survey_submissions.answer_indexes(SURVEY, 'v1')['activities_nature'].total == 1
+
+
+def test_full_batch_is_written_at_once(log_path, monkeypatch):
+    monkeypatch.setattr(survey_submissions, 'FLUSH_INTERVAL', 60)
+    for _ in range(survey_submissions.BATCH_SIZE):
+        survey_submissions.add_submission(ANSWERS)
+
+    assert len(logged_lines(log_path)) == survey_submissions.BATCH_SIZE
+    assert survey_submissions._state['flush_timer'] is None
+
+
+def test_single_submission_is_written_by_the_timer(log_path, monkeypatch):
+    monkeypatch.setattr(survey_submissions, 'FLUSH_INTERVAL', 0.05)
+    survey_submissions.add_submission(ANSWERS)
+
+    deadline = time.monotonic() + 5
+    while not logged_lines(log_path) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(logged_lines(log_path)) == 1
+    assert json.loads(logged_lines(log_path)[0])['ecoanxiety_status'] == 4
+
+
+def test_append_after_a_cut_off_line(log_path):
+    log_path.write_text('{"ecoanxiety_status": 3, "sustai', encoding='utf-8')
+    survey_submissions.add_submission(ANSWERS)
+    survey_submissions.flush_submissions()
+
+    assert len(survey_submissions._read_log(str(log_path))) == 1
+
+
+def test_add_submission_validates_answers(log_path):
+    with pytest.raises(ValueError):
+        survey_submissions.add_submission(dict(ANSWERS, ecoanxiety_status=8))
+    assert survey_submissions.answer_indexes(SURVEY, 'v1')['ecoanxiety_status'].total == 0